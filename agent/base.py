@@ -5,47 +5,421 @@ This module provides the core AIAgent class with message processing,
 conversation history management, and extensible response handling.
 """
 
+import asyncio
+import functools
+import inspect
 import logging
 import re
+import sys
+import time
+from contextvars import ContextVar
 from collections import deque
-from datetime import datetime
+from itertools import islice
+from string import capwords
 from typing import Dict, List, Optional, Tuple, Callable, Awaitable
 
+try:
+    import ahocorasick  # C-accelerated Aho-Corasick (optional)
+except ImportError:
+    ahocorasick = None
+
 from agent.responses import ResponseGenerator
 from utils.weather import get_weather_service, parse_location_from_message, DEFAULT_LOCATION
 from utils.news import get_news_service
 
 logger = logging.getLogger(__name__)
 
+# Advisory processing state, context-local so concurrent requests on a
+# shared agent don't race on an instance attribute
+_STATUS: ContextVar[str] = ContextVar("agent_status", default="idle")
+
+# Interned response-type values reused across every response dict
+_CHAT = sys.intern("chat")
+_ERROR = sys.intern("error")
+_NEWS = sys.intern("news")
+_WEATHER = sys.intern("weather")
+
+def _utcnow_iso() -> str:
+    """
+    Current UTC time as an ISO-8601 string (microsecond precision).
+
+    Formats straight from one time.time() reading instead of constructing a
+    datetime object per call; output matches datetime.utcnow().isoformat().
+    """
+    now = time.time()
+    return "%s.%06d" % (
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)),
+        int((now % 1) * 1_000_000),
+    )
+
+
+# ASCII A-Z -> a-z translation table for the lowercasing fast path
+_ASCII_LOWER_TABLE = str.maketrans(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'
+)
+
+
+def _fast_lower(text: str) -> str:
+    """
+    Lowercase a string with an ASCII fast path.
+
+    Chat input is overwhelmingly ASCII and often already lowercase; in that
+    case this returns the original string with zero allocation, and otherwise
+    uses a C-level translate instead of the full Unicode case-fold.
+    """
+    if text.isascii():
+        return text if text.islower() else text.translate(_ASCII_LOWER_TABLE)
+    return text.lower()
+
+
+# Comma-with-trailing-whitespace normalization, compiled once
+_COMMA_WS_RE = re.compile(r',\s+')
+
+
+@functools.lru_cache(maxsize=512)
+def _format_location_name(location: str) -> str:
+    """
+    Format a location name for display.
+
+    Pure string-to-string mapping, memoized since users ask about the same
+    handful of locations repeatedly.
+    """
+    location_lower = location.lower().strip()
+    # Normalize for lookup (remove spaces after commas)
+    location_normalized = _COMMA_WS_RE.sub(',', location_lower)
+
+    # Try exact match first
+    if location_normalized in _LOCATION_NAMES:
+        return _LOCATION_NAMES[location_normalized]
+
+    # Try without state abbreviation
+    location_no_state = location_normalized.split(',')[0].strip()
+    if location_no_state in _LOCATION_NAMES:
+        return _LOCATION_NAMES[location_no_state]
+
+    # Otherwise, capitalize properly (capwords handles whitespace in one pass)
+    return ', '.join(capwords(part) for part in location.split(','))
+
+
+# Follow-up weather questions ("how about Boston?") and their location,
+# detected and captured in a single pass over the lowercased message
+_FOLLOWUP_RE = re.compile(
+    r"(?:how about|what about|and in|and at|and for|how's|what's the weather in|weather in)\s+(.+)"
+)
+
+# Above this many distinct keywords, dispatch compiles an Aho-Corasick
+# automaton instead of a single alternation regex
+_REGEX_DISPATCH_MAX_KEYWORDS = 100
+
+# Dispatch-cache bounds; the sentinel distinguishes a cache miss from a
+# cached "no handler matched"
+_DISPATCH_CACHE_MAX = 1024
+_CACHE_MISS = object()
+
+# Pre-sized response template; copying it reuses the existing hash layout
+# instead of growing a fresh dict key by key on every request
+_RESPONSE_TEMPLATE = {
+    "content": None,
+    "type": _CHAT,
+    "timestamp": None,
+    "user_id": None,
+    "metadata": None,
+}
+
+# Static part of the error response; errors can burst when an upstream
+# service is down, so only the timestamp and user_id are built per error
+_ERROR_TEMPLATE = {
+    "content": "I encountered an error processing your message. Please try again.",
+    "type": _ERROR,
+}
+
+# Display names for known locations, keyed by normalized lowercase form.
+# Built once at import time so weather requests avoid rebuilding the table.
+# Note: More specific locations (neighborhoods) are listed first
+_LOCATION_NAMES = {
+    # Specific neighborhoods (check first)
+    "little neck,ny": "Little Neck, NY",
+    "little neck": "Little Neck, NY",
+    "huntington,ny": "Huntington, NY",
+    "huntington": "Huntington, NY",
+    # Boroughs
+    "queens,ny": "Queens, NY",
+    "queens": "Queens, NY",
+    "manhattan,ny": "Manhattan, NY",
+    "manhattan": "Manhattan, NY",
+    "brooklyn,ny": "Brooklyn, NY",
+    "brooklyn": "Brooklyn, NY",
+    "bronx,ny": "Bronx, NY",
+    "bronx": "Bronx, NY",
+    "staten island,ny": "Staten Island, NY",
+    "staten island": "Staten Island, NY",
+    # General city
+    "new york,ny": "New York, NY",
+    "new york": "New York, NY",
+}
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton for multi-keyword matching.
+
+    Compiles all handler keywords into a single trie with failure links so a
+    message is scanned once in O(len(message)) instead of running a separate
+    substring search per handler per keyword. The iteration interface matches
+    pyahocorasick's Automaton, which is preferred when installed.
+    """
+
+    def __init__(self):
+        # Each state is a dict mapping character -> next state index
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+    def add_word(self, word: str, value) -> None:
+        """Add a keyword to the trie with an associated value."""
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(value)
+
+    def make_automaton(self) -> None:
+        """Build failure links via BFS so the automaton is ready for scanning."""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def iter(self, text: str):
+        """
+        Yield (end_index, value) for every keyword found in text.
+
+        Single pass; the tuple shape mirrors ahocorasick.Automaton.iter so
+        the two implementations are interchangeable.
+        """
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for value in self._output[state]:
+                yield index, value
+
+
+class ConversationHistory:
+    """
+    Bounded conversation store backed by parallel deques.
+
+    Entries are stored column-wise (struct-of-arrays) instead of one dict per
+    row, roughly halving per-entry memory overhead. A per-user index of
+    sequence numbers lets user-filtered reads touch only matching rows.
+    Entry dicts are materialized only at the read boundary.
+    """
+
+    def __init__(self, maxlen: int):
+        """
+        Initialize the history store.
+
+        Args:
+            maxlen: Maximum number of entries to retain
+        """
+        self.maxlen = maxlen
+        self._timestamps = deque(maxlen=maxlen)
+        self._user_ids = deque(maxlen=maxlen)
+        self._messages = deque(maxlen=maxlen)
+        self._responses = deque(maxlen=maxlen)
+        # Monotonic sequence number of the next append; seq - len gives the
+        # sequence number of the oldest retained row
+        self._seq = 0
+        self._user_index: Dict[str, deque] = {}
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def append(self, timestamp: str, user_id: str, message: str, response: str):
+        """Append one entry, evicting the oldest when full."""
+        if self.maxlen and len(self._timestamps) == self.maxlen:
+            # The columns will evict their oldest row; drop it from the index
+            evicted_user = self._user_ids[0]
+            evicted_seqs = self._user_index.get(evicted_user)
+            if evicted_seqs:
+                evicted_seqs.popleft()
+                if not evicted_seqs:
+                    del self._user_index[evicted_user]
+        self._timestamps.append(timestamp)
+        self._user_ids.append(user_id)
+        self._messages.append(message)
+        self._responses.append(response)
+        self._user_index.setdefault(user_id, deque()).append(self._seq)
+        self._seq += 1
+
+    def _entry(self, position: int) -> Dict:
+        """Build the boundary dict for the row at the given position."""
+        return {
+            "timestamp": self._timestamps[position],
+            "user_id": self._user_ids[position],
+            "message": self._messages[position],
+            "response": self._responses[position],
+        }
+
+    def entries(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Return entry dicts, oldest first.
+
+        Args:
+            limit: Optional cap; only the newest `limit` entries are returned
+        """
+        if limit:
+            # Walk from the right so a limited read touches O(limit) rows
+            rows = islice(
+                zip(reversed(self._timestamps), reversed(self._user_ids),
+                    reversed(self._messages), reversed(self._responses)),
+                limit
+            )
+            return [
+                {"timestamp": ts, "user_id": uid, "message": msg, "response": resp}
+                for ts, uid, msg, resp in rows
+            ][::-1]
+        return [
+            {"timestamp": ts, "user_id": uid, "message": msg, "response": resp}
+            for ts, uid, msg, resp in zip(
+                self._timestamps, self._user_ids, self._messages, self._responses
+            )
+        ]
+
+    def entries_for_user(self, user_id: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Return entry dicts for one user, oldest first.
+
+        Args:
+            user_id: User to filter by
+            limit: Optional cap; only the newest `limit` matches are returned
+        """
+        seqs = self._user_index.get(user_id)
+        if not seqs:
+            return []
+        base = self._seq - len(self._timestamps)
+        if limit:
+            newest = list(islice(reversed(seqs), limit))
+            return [self._entry(seq - base) for seq in reversed(newest)]
+        return [self._entry(seq - base) for seq in seqs]
+
+    def remove_user(self, user_id: str):
+        """Remove all entries for one user, preserving order of the rest."""
+        removed = self._user_index.pop(user_id, None)
+        if removed is None:
+            # Nothing to remove
+            return
+        if len(removed) == len(self._timestamps):
+            # The user owns every row; skip the rotation entirely
+            self.clear()
+            return
+        # Rotate the columns in lockstep, dropping the user's rows
+        for _ in range(len(self._timestamps)):
+            ts = self._timestamps.popleft()
+            uid = self._user_ids.popleft()
+            msg = self._messages.popleft()
+            resp = self._responses.popleft()
+            if uid != user_id:
+                self._timestamps.append(ts)
+                self._user_ids.append(uid)
+                self._messages.append(msg)
+                self._responses.append(resp)
+        # Renumber so sequence numbers equal positions again
+        self._seq = len(self._timestamps)
+        self._user_index = {}
+        for position, uid in enumerate(self._user_ids):
+            self._user_index.setdefault(uid, deque()).append(position)
+
+    def clear(self):
+        """Remove all entries."""
+        self._timestamps.clear()
+        self._user_ids.clear()
+        self._messages.clear()
+        self._responses.clear()
+        self._seq = 0
+        self._user_index = {}
+
 
 class MessageHandler:
     """Handler for pattern matching and response generation."""
 
-    def __init__(self, keywords: List[str], handler: Callable[[str], str],
+    def __init__(self, keywords: List[str], handler: Callable[..., str],
                  require_all: bool = False):
         """
         Initialize a message handler.
 
         Args:
             keywords: List of keywords to match in the message
-            handler: Function to call when pattern matches
+            handler: Function to call when pattern matches; may take the
+                message as its only argument or no arguments at all
             require_all: If True, all keywords must be present; if False, any keyword
         """
-        self.keywords = keywords
+        self.keywords = tuple(keywords)
         self.handler = handler
         self.require_all = require_all
+        # Precompute lowercased keywords once so matching never re-lowercases;
+        # the frozenset supports C-level intersection tests during dispatch
+        self._keywords_lower = tuple(keyword.lower() for keyword in self.keywords)
+        self._keywords_set = frozenset(self._keywords_lower)
+        # Classify the handler once at registration so dispatch avoids
+        # per-call introspection
+        self._takes_message = bool(inspect.signature(handler).parameters)
+        self.is_async = inspect.iscoroutinefunction(handler)
+        # One compiled alternation replaces N substring scans for the
+        # any-match case; IGNORECASE lets matches() skip the lowercase copy
+        if not require_all:
+            self._any_re = re.compile(
+                '|'.join(re.escape(keyword) for keyword in self._keywords_lower),
+                re.IGNORECASE
+            )
+        else:
+            self._any_re = None
 
     def matches(self, message: str) -> bool:
         """Check if this handler matches the given message."""
-        message_lower = message.lower()
+        if self._any_re is not None:
+            return bool(self._any_re.search(message))
+        return self.matches_lower(_fast_lower(message))
+
+    def matches_lower(self, message_lower: str) -> bool:
+        """
+        Check if this handler matches an already-lowercased message.
+
+        Args:
+            message_lower: The message text, lowercased by the caller
+
+        Returns:
+            bool: True if the handler's keyword condition is satisfied
+        """
         if self.require_all:
-            return all(keyword in message_lower for keyword in self.keywords)
+            return all(keyword in message_lower for keyword in self._keywords_lower)
         else:
-            return any(keyword in message_lower for keyword in self.keywords)
+            return bool(self._any_re.search(message_lower))
 
     def handle(self, message: str) -> str:
         """Execute the handler and return the response."""
-        return self.handler(message)
+        if self._takes_message:
+            return self.handler(message)
+        return self.handler()
 
 
 class AIAgent:
@@ -62,8 +436,13 @@ class AIAgent:
         max_history: Maximum number of conversation entries to retain
     """
 
+    # In-flight weather lookups keyed by location, shared across all agents,
+    # so bursts of identical questions issue a single upstream fetch
+    _weather_inflight: Dict[str, asyncio.Future] = {}
+
     def __init__(self, name: str = "AI Assistant", version: str = "2.0.0",
-                 max_history: int = 1000):
+                 max_history: int = 1000, max_scan_chars: int = 4096,
+                 record_history: bool = True):
         """
         Initialize the AI Agent.
 
@@ -71,18 +450,42 @@ class AIAgent:
             name: Name of the agent
             version: Version string
             max_history: Maximum conversation history entries to keep
+            max_scan_chars: Maximum number of leading characters scanned for
+                keyword dispatch; bounds per-message matching cost for
+                pathologically long inputs
+            record_history: If False, skip conversation history recording
+                entirely; for deployments that never read it back, this
+                removes the per-request timestamp and append work
         """
         self.name = name
         self.version = version
-        self.status = "idle"
         self.max_history = max_history
-        self.conversation_history = deque(maxlen=max_history)
-        self.response_gen = ResponseGenerator()
+        self.max_scan_chars = max_scan_chars
+        self.record_history = record_history
+        self.conversation_history = ConversationHistory(max_history)
+
+        # Bind the shared service singletons once instead of looking them
+        # up on every request
+        self._weather_service = get_weather_service()
+        self._news_service = get_news_service()
 
         # Initialize message handlers in priority order
         self._init_handlers()
 
-        logger.info(f"Initialized {self.name} v{self.version}")
+        # Bounded cache of normalized message -> winning handler index
+        self._dispatch_cache: Dict[str, Optional[int]] = {}
+
+        logger.info("Initialized %s v%s", self.name, self.version)
+
+    @property
+    def status(self) -> str:
+        """Advisory processing state for the current execution context."""
+        return _STATUS.get()
+
+    @functools.cached_property
+    def response_gen(self) -> ResponseGenerator:
+        """Lazily constructed response generator (built on first use)."""
+        return ResponseGenerator()
 
     def _init_handlers(self):
         """Initialize the message handlers in priority order."""
@@ -90,31 +493,31 @@ class AIAgent:
             # Weather + joke combination (check first - most specific)
             MessageHandler(
                 keywords=['weather', 'joke'],
-                handler=self._handle_weather_joke,
+                handler=functools.partial(self._handle_weather, include_joke=True),
                 require_all=True
             ),
             # Weather only
             MessageHandler(
                 keywords=['weather', 'forecast', 'temperature'],
-                handler=self._handle_weather_info,
+                handler=functools.partial(self._handle_weather, include_joke=False),
                 require_all=False
             ),
             # Jokes
             MessageHandler(
                 keywords=['joke', 'funny', 'humor', 'laugh'],
-                handler=lambda msg: self.response_gen.get_general_joke(),
+                handler=ResponseGenerator.get_general_joke,
                 require_all=False
             ),
             # Greetings
             MessageHandler(
                 keywords=['hello', 'hi', 'hey', 'greetings'],
-                handler=lambda msg: self.response_gen.get_greeting(),
+                handler=ResponseGenerator.get_greeting,
                 require_all=False
             ),
             # Help
             MessageHandler(
                 keywords=['help', 'commands', 'what can you do'],
-                handler=lambda msg: self.response_gen.get_help_text(),
+                handler=ResponseGenerator.get_help_text,
                 require_all=False
             ),
             # News
@@ -125,6 +528,65 @@ class AIAgent:
             ),
         ]
 
+        # Compile all handler keywords into a single-pass matcher. For small
+        # keyword sets one C-level alternation regex beats the Python-level
+        # automaton walk; past the threshold the Aho-Corasick automaton wins.
+        self._keyword_to_handlers: Dict[str, List[int]] = {}
+        for handler_idx, handler in enumerate(self.handlers):
+            for keyword in handler._keywords_lower:
+                self._keyword_to_handlers.setdefault(keyword, []).append(handler_idx)
+
+        self._automaton = None
+        self._keyword_re = None
+        if len(self._keyword_to_handlers) <= _REGEX_DISPATCH_MAX_KEYWORDS:
+            # Longer alternatives first so overlapping keywords prefer the
+            # most specific match at any given position
+            alternation = "|".join(
+                re.escape(keyword)
+                for keyword in sorted(self._keyword_to_handlers, key=len, reverse=True)
+            )
+            self._keyword_re = re.compile(alternation)
+        else:
+            # Prefer the C implementation when installed
+            if ahocorasick is not None:
+                self._automaton = ahocorasick.Automaton()
+            else:
+                self._automaton = KeywordAutomaton()
+            for keyword in self._keyword_to_handlers:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+        # Fast path: map each keyword of the any-match handlers to the first
+        # (highest-priority) handler that owns it, so a bare single-keyword
+        # message dispatches with one dict probe instead of a scan.
+        self._fastpath: Dict[str, int] = {}
+        for handler_idx, handler in enumerate(self.handlers):
+            if not handler.require_all:
+                for keyword in handler._keywords_lower:
+                    self._fastpath.setdefault(keyword, handler_idx)
+
+    def _match_handlers(self, message_lower: str) -> Dict[int, set]:
+        """
+        Scan the message once and collect matched keywords per handler.
+
+        Args:
+            message_lower: The lowercased message text
+
+        Returns:
+            dict: Mapping of handler index to the set of matched keywords
+        """
+        matched: Dict[int, set] = {}
+        if self._keyword_re is not None:
+            for match in self._keyword_re.finditer(message_lower):
+                keyword = match.group()
+                for handler_idx in self._keyword_to_handlers[keyword]:
+                    matched.setdefault(handler_idx, set()).add(keyword)
+        else:
+            for _, keyword in self._automaton.iter(message_lower):
+                for handler_idx in self._keyword_to_handlers[keyword]:
+                    matched.setdefault(handler_idx, set()).add(keyword)
+        return matched
+
     async def process_message(self, message: str, user_id: str = "default", location: Optional[Dict] = None, context: Optional[Dict] = None) -> Dict:
         """
         Process a user message and generate a response.
@@ -146,22 +608,20 @@ class AIAgent:
         if not message or not isinstance(message, str):
             raise ValueError("Message must be a non-empty string")
 
-        self.status = "processing"
-        logger.info(f"Processing message from user {user_id}: {message[:50]}...")
+        # Intern the user_id so repeated requests from the same user hash a
+        # cached string instead of allocating a new one per dict insert
+        if isinstance(user_id, str):
+            user_id = sys.intern(user_id)
+
+        status_token = _STATUS.set("processing")
+        logger.info("Processing message from user %s: %.50s...", user_id, message)
 
         try:
-            # Check if this is a follow-up question that needs context
-            message_lower = message.lower()
-            is_follow_up = any(phrase in message_lower for phrase in [
-                'how about', 'what about', 'and in', 'and at', 'and for', 
-                "how's", "what's the weather in", 'weather in'
-            ])
-            
-            # If it's a follow-up and we have context, use it
-            if is_follow_up and context and context.get('type') == 'weather':
-                # Extract location from follow-up message
-                import re
-                location_match = re.search(r'(?:how about|what about|and in|and at|and for|how\'s|what\'s the weather in|weather in)\s+(.+)', message_lower)
+            # Follow-up questions that need context ("how about Boston?")
+            # reuse the previous weather conversation; one regex pass both
+            # detects the follow-up and captures its location
+            if context and context.get('type') == 'weather':
+                location_match = _FOLLOWUP_RE.search(_fast_lower(message))
                 if location_match:
                     location_str = location_match.group(1).strip()
                     # Reconstruct message with context
@@ -172,65 +632,65 @@ class AIAgent:
             
             # Check if this is a news or weather response and include data in metadata
             metadata = {}
-            if response_type == "news":
-                news_service = get_news_service()
-                articles = await news_service.get_headlines(limit=5)
+            if response_type == _NEWS:
+                # Use articles from the handler (already fetched); only fall
+                # back to a fresh fetch if they weren't provided
+                articles = extra_data.get("articles")
+                if articles is None:
+                    news_service = self._news_service
+                    articles = await news_service.get_headlines(limit=5)
                 metadata["articles"] = articles
-                metadata["type"] = "news"
-            elif response_type == "weather":
+                metadata["type"] = _NEWS
+            elif response_type == _WEATHER:
                 # Use weather data from handler (already fetched, no need to fetch again)
                 if "weather" in extra_data:
                     metadata["weather"] = extra_data["weather"]
-                    metadata["type"] = "weather"
+                    metadata["type"] = _WEATHER
                 else:
                     # Fallback: fetch if not provided (shouldn't happen, but just in case)
-                    weather_service = get_weather_service()
+                    weather_service = self._weather_service
                     if location and location.get('lat') and location.get('lon'):
                         lat = location['lat']
                         lon = location['lon']
                         city_name = location.get('city')
                         # If no city name provided, use coordinates and let weather service determine location
                         if not city_name:
-                            weather_data = await weather_service.get_weather(city="", lat=lat, lon=lon)
+                            weather_data = await self._fetch_weather(f"{lat},{lon}", city="", lat=lat, lon=lon)
                             # Use the location name returned by the weather service
                             weather_data["location"] = weather_data.get("location", f"{lat:.2f}, {lon:.2f}")
                         else:
-                            weather_data = await weather_service.get_weather(city=city_name, lat=lat, lon=lon)
+                            weather_data = await self._fetch_weather(f"{lat},{lon}", city=city_name, lat=lat, lon=lon)
                             weather_data["location"] = city_name
                     else:
                         location_str = parse_location_from_message(message) or DEFAULT_LOCATION
                         display_location = self._format_location_name(location_str)
-                        weather_data = await weather_service.get_weather(city=location_str)
+                        weather_data = await self._fetch_weather(location_str, city=location_str)
                         weather_data["location"] = display_location
                     metadata["weather"] = weather_data
-                    metadata["type"] = "weather"
+                    metadata["type"] = _WEATHER
 
-            # Create response object
-            response = {
-                "content": response_content,
-                "type": "chat",
-                "timestamp": datetime.utcnow().isoformat(),
-                "user_id": user_id,
-                "metadata": metadata
-            }
+            # Create response object (one clock read shared with history)
+            now_iso = _utcnow_iso()
+            response = _RESPONSE_TEMPLATE.copy()
+            response["content"] = response_content
+            response["timestamp"] = now_iso
+            response["user_id"] = user_id
+            response["metadata"] = metadata
 
             # Add to conversation history
-            self._add_to_history(message, response_content, user_id)
+            if self.record_history:
+                self._add_to_history(message, response_content, user_id, timestamp=now_iso)
 
-            self.status = "idle"
-            logger.debug(f"Generated response: {response_content[:50]}...")
+            _STATUS.reset(status_token)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Generated response: %.50s...", response_content)
 
             return response
 
         except Exception as e:
-            self.status = "error"
-            logger.error(f"Error processing message: {e}", exc_info=True)
-            return {
-                "content": "I encountered an error processing your message. Please try again.",
-                "type": "error",
-                "timestamp": datetime.utcnow().isoformat(),
-                "user_id": user_id
-            }
+            _STATUS.reset(status_token)
+            logger.error("Error processing message: %s", e, exc_info=True)
+            return {**_ERROR_TEMPLATE, "timestamp": _utcnow_iso(), "user_id": user_id}
 
     async def _generate_response(self, message: str, location: Optional[Dict] = None) -> Tuple[str, Optional[str], Optional[Dict]]:
         """
@@ -246,87 +706,141 @@ class AIAgent:
                 - response_type: Type of response (news, weather, etc.)
                 - extra_data: Additional data (e.g., weather_data for weather responses)
         """
-        # Try each handler in order
-        for handler in self.handlers:
-            if handler.matches(message):
-                # Pass location to weather handlers
-                if 'weather' in handler.keywords:
-                    # Check if it's one of our weather handler methods
-                    handler_func = handler.handler
-                    if handler_func == self._handle_weather_info:
-                        result, weather_data = await self._handle_weather_info(message, location=location, return_data=True)
-                    elif handler_func == self._handle_weather_joke:
-                        result, weather_data = await self._handle_weather_joke(message, location=location, return_data=True)
-                    else:
-                        # Lambda or other handler, call normally
-                        result = handler.handle(message)
-                        weather_data = None
-                else:
-                    result = handler.handle(message)
-                    weather_data = None
-                
-                # Handle async handlers
-                if hasattr(result, '__await__'):
-                    response_text = await result
-                else:
-                    response_text = result
-                
-                # Determine response type based on handler keywords
-                response_type = None
-                extra_data = {}
-                if 'news' in handler.keywords or 'headlines' in handler.keywords:
-                    response_type = "news"
-                elif 'weather' in handler.keywords:
-                    response_type = "weather"
-                    if weather_data:
-                        extra_data["weather"] = weather_data
-                
-                return response_text, response_type, extra_data
-
-        # No handler matched - use default response
-        return self.response_gen.get_default_response(), None, {}
-
-    async def _handle_weather_joke(self, message: str, location: Optional[Dict] = None, return_data: bool = False):
-        """Handle weather joke request with real weather data."""
-        weather_service = get_weather_service()
-        
-        # Use provided location (from geolocation) if available, otherwise parse from message
-        if location and location.get('lat') and location.get('lon'):
-            # Use user's current location
-            lat = location['lat']
-            lon = location['lon']
-            city_name = location.get('city')
-            # If no city name provided, use coordinates and let weather service determine location
-            if not city_name:
-                weather_data = await weather_service.get_weather(city="", lat=lat, lon=lon)
-                # Use the location name returned by the weather service
-                display_location = weather_data.get("location", f"{lat:.2f}, {lon:.2f}")
+        # Scan only a bounded prefix so dispatch cost stays flat no matter
+        # how large the input is; keywords are short and appear early
+        message_lower = _fast_lower(message[:self.max_scan_chars])
+
+        # Fast path: a bare single-keyword message maps straight to its handler
+        fast_idx = self._fastpath.get(message_lower.strip(' .,!?'))
+        if fast_idx is not None:
+            return await self._run_handler(self.handlers[fast_idx], message, location)
+
+        # Repeat queries resolve through a bounded cache of message -> chosen
+        # handler. The handler itself still runs, so randomized responses and
+        # live weather/news data stay fresh.
+        handler_idx = self._dispatch_cache.get(message_lower, _CACHE_MISS)
+        if handler_idx is _CACHE_MISS:
+            handler_idx = self._resolve_handler(message_lower)
+            if len(self._dispatch_cache) >= _DISPATCH_CACHE_MAX:
+                self._dispatch_cache.clear()
+            self._dispatch_cache[message_lower] = handler_idx
+
+        if handler_idx is None:
+            # No handler matched - use default response
+            return self.response_gen.get_default_response(), None, {}
+        return await self._run_handler(self.handlers[handler_idx], message, location)
+
+    def _resolve_handler(self, message_lower: str) -> Optional[int]:
+        """
+        Resolve the handler for a lowercased message.
+
+        Args:
+            message_lower: The lowercased (bounded) message text
+
+        Returns:
+            int: Index of the winning handler, or None if nothing matched
+        """
+        matched = self._match_handlers(message_lower)
+        for handler_idx, handler in enumerate(self.handlers):
+            keywords_hit = matched.get(handler_idx)
+            if not keywords_hit:
+                continue
+            if not handler.require_all or keywords_hit >= handler._keywords_set:
+                return handler_idx
+        return None
+
+    async def _run_handler(self, handler: MessageHandler, message: str,
+                           location: Optional[Dict] = None) -> Tuple[str, Optional[str], Optional[Dict]]:
+        """
+        Execute a matched handler and package its result.
+
+        Args:
+            handler: The matched MessageHandler
+            message: The user's message
+            location: Optional location data
+
+        Returns:
+            tuple: (response_text, response_type, extra_data)
+        """
+        news_data = None
+        # Pass location to weather handlers
+        if 'weather' in handler.keywords:
+            # Check if it's one of our weather handler methods
+            handler_func = handler.handler
+            if getattr(handler_func, 'func', None) == self._handle_weather:
+                response_text, weather_data = await handler_func(message, location=location, return_data=True)
             else:
-                display_location = city_name
-                weather_data = await weather_service.get_weather(city=city_name, lat=lat, lon=lon)
-                weather_data["location"] = city_name
+                # Other handler, call normally
+                if handler.is_async:
+                    response_text = await handler.handle(message)
+                else:
+                    response_text = handler.handle(message)
+                weather_data = None
+        elif handler.handler == self._handle_news_request:
+            # News handler returns its articles so process_message doesn't
+            # have to fetch them a second time for the metadata
+            response_text, news_data = await self._handle_news_request(message, return_data=True)
+            weather_data = None
         else:
-            # Parse location from message, default to Queens, NY
-            location_str = parse_location_from_message(message) or DEFAULT_LOCATION
-            # Format location name for display - this is critical for showing correct location
-            display_location = self._format_location_name(location_str)
-            # Pass the original location_str to get_weather so it can use correct coordinates
-            weather_data = await weather_service.get_weather(city=location_str)
-            # Override the location in weather_data with our formatted name
-            weather_data["location"] = display_location
-        
-        # Always use display_location to ensure correct location name is shown
-        response_text = weather_service.format_weather_response(weather_data, include_joke=True, 
-                                                      requested_location=display_location)
-        
-        if return_data:
-            return response_text, weather_data
-        return response_text
+            # Async-ness was classified at registration; no per-call probing
+            if handler.is_async:
+                response_text = await handler.handle(message)
+            else:
+                response_text = handler.handle(message)
+            weather_data = None
+
+        # Determine response type based on handler keywords
+        response_type = None
+        extra_data = {}
+        if 'news' in handler.keywords or 'headlines' in handler.keywords:
+            response_type = _NEWS
+            if news_data is not None:
+                extra_data["articles"] = news_data
+        elif 'weather' in handler.keywords:
+            response_type = _WEATHER
+            if weather_data:
+                extra_data["weather"] = weather_data
+
+        return response_text, response_type, extra_data
+
+    async def _fetch_weather(self, key: str, **kwargs) -> Dict:
+        """
+        Fetch weather data, coalescing concurrent lookups for the same location.
+
+        Concurrent callers asking about the same location share one upstream
+        request: the first caller creates a future, performs the fetch, and
+        fans the result out to every waiter.
+
+        Args:
+            key: Coalescing key identifying the location
+            **kwargs: Arguments forwarded to WeatherService.get_weather
 
-    async def _handle_weather_info(self, message: str, location: Optional[Dict] = None, return_data: bool = False):
-        """Handle weather info request with real weather data."""
-        weather_service = get_weather_service()
-        
+        Returns:
+            dict: Weather data (a per-caller copy, safe to mutate)
+        """
+        future = self._weather_inflight.get(key)
+        if future is not None:
+            return dict(await future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._weather_inflight[key] = future
+        try:
+            weather_data = await self._weather_service.get_weather(**kwargs)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved so a waiterless failure doesn't
+            # warn at GC; waiters awaiting the future still see the raise
+            future.exception()
+            raise
+        else:
+            future.set_result(weather_data)
+            return dict(weather_data)
+        finally:
+            self._weather_inflight.pop(key, None)
+
+    async def _handle_weather(self, message: str, *, include_joke: bool,
+                              location: Optional[Dict] = None, return_data: bool = False):
+        """Handle a weather request (optionally with a joke) using real weather data."""
         # Use provided location (from geolocation) if available, otherwise parse from message
         if location and location.get('lat') and location.get('lon'):
             # Use user's current location
@@ -335,12 +849,12 @@ class AIAgent:
             city_name = location.get('city')
             # If no city name provided, use coordinates and let weather service determine location
             if not city_name:
-                weather_data = await weather_service.get_weather(city="", lat=lat, lon=lon)
+                weather_data = await self._fetch_weather(f"{lat},{lon}", city="", lat=lat, lon=lon)
                 # Use the location name returned by the weather service
                 display_location = weather_data.get("location", f"{lat:.2f}, {lon:.2f}")
             else:
                 display_location = city_name
-                weather_data = await weather_service.get_weather(city=city_name, lat=lat, lon=lon)
+                weather_data = await self._fetch_weather(f"{lat},{lon}", city=city_name, lat=lat, lon=lon)
                 weather_data["location"] = city_name
         else:
             # Parse location from message, default to Queens, NY
@@ -348,73 +862,35 @@ class AIAgent:
             # Format location name for display - this is critical for showing correct location
             display_location = self._format_location_name(location_str)
             # Pass the original location_str to get_weather so it can use correct coordinates
-            weather_data = await weather_service.get_weather(city=location_str)
+            weather_data = await self._fetch_weather(location_str, city=location_str)
             # Override the location in weather_data with our formatted name
             weather_data["location"] = display_location
-        
+
         # Always use display_location to ensure correct location name is shown
-        response_text = weather_service.format_weather_response(weather_data, include_joke=False,
-                                                      requested_location=display_location)
-        
+        response_text = self._weather_service.format_weather_response(
+            weather_data, include_joke=include_joke, requested_location=display_location)
+
         if return_data:
             return response_text, weather_data
         return response_text
 
-    async def _handle_news_request(self, message: str) -> str:
+    async def _handle_news_request(self, message: str, return_data: bool = False):
         """Handle news request with real news data."""
-        news_service = get_news_service()
+        news_service = self._news_service
         articles = await news_service.get_headlines(limit=5)
         # Return formatted text response (for CLI compatibility)
         # Articles are also available in the response metadata for web UI
-        return news_service.format_news_response(articles)
+        response_text = news_service.format_news_response(articles)
+        if return_data:
+            return response_text, articles
+        return response_text
     
-    def _format_location_name(self, location: str) -> str:
-        """Format location name for display."""
-        location_lower = location.lower().strip()
-        # Normalize for lookup (remove spaces after commas)
-        location_normalized = re.sub(r',\s+', ',', location_lower)
-        
-        location_names = {
-            # Specific neighborhoods (check first)
-            "little neck,ny": "Little Neck, NY",
-            "little neck": "Little Neck, NY",
-            "huntington,ny": "Huntington, NY",
-            "huntington": "Huntington, NY",
-            # Boroughs
-            "queens,ny": "Queens, NY",
-            "queens": "Queens, NY",
-            "manhattan,ny": "Manhattan, NY",
-            "manhattan": "Manhattan, NY",
-            "brooklyn,ny": "Brooklyn, NY",
-            "brooklyn": "Brooklyn, NY",
-            "bronx,ny": "Bronx, NY",
-            "bronx": "Bronx, NY",
-            "staten island,ny": "Staten Island, NY",
-            "staten island": "Staten Island, NY",
-            # General city
-            "new york,ny": "New York, NY",
-            "new york": "New York, NY",
-        }
-        
-        # Try exact match first
-        if location_normalized in location_names:
-            return location_names[location_normalized]
-        
-        # Try without state abbreviation
-        location_no_state = location_normalized.split(',')[0].strip()
-        if location_no_state in location_names:
-            return location_names[location_no_state]
-        
-        # Otherwise, capitalize properly
-        parts = location.split(',')
-        formatted_parts = []
-        for part in parts:
-            words = part.strip().split()
-            formatted_words = [word.capitalize() for word in words]
-            formatted_parts.append(' '.join(formatted_words))
-        return ', '.join(formatted_parts)
-
-    def _add_to_history(self, message: str, response: str, user_id: str):
+    # Memoized module-level function, exposed as a static method so existing
+    # call sites keep their shape
+    _format_location_name = staticmethod(_format_location_name)
+
+    def _add_to_history(self, message: str, response: str, user_id: str,
+                        timestamp: Optional[str] = None):
         """
         Add a conversation entry to history.
 
@@ -422,15 +898,17 @@ class AIAgent:
             message: User's message
             response: Agent's response
             user_id: User identifier
+            timestamp: Optional precomputed ISO timestamp (avoids a second
+                clock read when the caller already has one)
         """
-        entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "user_id": user_id,
-            "message": message,
-            "response": response
-        }
-        self.conversation_history.append(entry)
-        logger.debug(f"Added entry to history (total: {len(self.conversation_history)})")
+        self.conversation_history.append(
+            timestamp or _utcnow_iso(),
+            user_id,
+            message,
+            response
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added entry to history (total: %d)", len(self.conversation_history))
 
     def get_status(self) -> Dict:
         """
@@ -459,17 +937,13 @@ class AIAgent:
         Returns:
             list: List of conversation history entries
         """
-        history = list(self.conversation_history)
-
-        # Filter by user_id if provided
         if user_id:
-            history = [entry for entry in history if entry.get("user_id") == user_id]
-
-        # Apply limit if provided
-        if limit:
-            history = history[-limit:]
+            # The per-user index visits only matching rows
+            history = self.conversation_history.entries_for_user(user_id, limit)
+        else:
+            history = self.conversation_history.entries(limit)
 
-        logger.debug(f"Retrieved {len(history)} history entries")
+        logger.debug("Retrieved %d history entries", len(history))
         return history
 
     def clear_history(self, user_id: Optional[str] = None):
@@ -481,12 +955,8 @@ class AIAgent:
         """
         if user_id:
             # Remove entries for specific user
-            self.conversation_history = deque(
-                (entry for entry in self.conversation_history
-                 if entry.get("user_id") != user_id),
-                maxlen=self.max_history
-            )
-            logger.info(f"Cleared history for user {user_id}")
+            self.conversation_history.remove_user(user_id)
+            logger.info("Cleared history for user %s", user_id)
         else:
             # Clear all history
             self.conversation_history.clear()
@@ -6,10 +6,11 @@ used by the AI agent for generating responses.
 """
 
 import random
-from typing import List
+from collections import deque
+from typing import Tuple
 
 # Weather jokes combining humor with weather information
-WEATHER_JOKES: List[str] = [
+WEATHER_JOKES: Tuple[str, ...] = (
     "I checked the weather for you! It's partly cloudy with a 100% chance of dad jokes! 🌤️ (Currently 72°F)",
     "The forecast shows sunny with occasional puns! ☀️ (Temperature: 68°F)",
     "Weather update: High chance of laughter, low chance of rain! 🌈 (Feels like 70°F)",
@@ -17,20 +18,20 @@ WEATHER_JOKES: List[str] = [
     "Meteorologically speaking, it's perfect joke-telling weather! 🌡️ (A comfortable 71°F)",
     "The weather is so nice, even my jokes are getting warmer! 🌞 (73°F)",
     "Forecast: Clear skies with a slight chance of groaning at my jokes! 🌅 (69°F)"
-]
+)
 
 # Weather information responses
-WEATHER_CONDITIONS: List[str] = [
+WEATHER_CONDITIONS: Tuple[str, ...] = (
     "It's a beautiful sunny day! Perfect for outdoor activities! ☀️ (Temperature: 75°F)",
     "Looks like partly cloudy skies today. Great weather for a walk! ⛅ (Currently 68°F)",
     "A bit overcast, but no rain expected. Don't forget your sunglasses just in case! 🌤️ (72°F)",
     "Clear skies and comfortable temperatures! Enjoy your day! 🌞 (70°F)",
     "Mild and pleasant weather conditions today! 🌈 (Temperature: 71°F)",
     "Beautiful weather outside! Time to get some fresh air! 🌸 (73°F)"
-]
+)
 
 # General jokes and puns
-GENERAL_JOKES: List[str] = [
+GENERAL_JOKES: Tuple[str, ...] = (
     "Why don't scientists trust atoms? Because they make up everything! 🔬",
     "I told my computer I needed a break, and now it won't stop sending me Kit-Kats! 🍫",
     "Why did the programmer quit his job? Because he didn't get arrays! 💻",
@@ -41,25 +42,25 @@ GENERAL_JOKES: List[str] = [
     "What do you call a fake noodle? An impasta! 🍝",
     "Why did the math book look so sad? Because it had too many problems! 📖",
     "What did the ocean say to the beach? Nothing, it just waved! 🌊"
-]
+)
 
 # Greeting responses
-GREETINGS: List[str] = [
+GREETINGS: Tuple[str, ...] = (
     "Hello! How can I help you today? 👋",
     "Hi there! What can I do for you? 😊",
     "Hey! Great to see you! How can I assist? 🌟",
     "Greetings! I'm here to help! 🤖",
     "Hello! Ready to chat? What's on your mind? 💬"
-]
+)
 
 # Default/fallback responses
-DEFAULT_RESPONSES: List[str] = [
+DEFAULT_RESPONSES: Tuple[str, ...] = (
     "I'm not sure I understand. Could you try asking differently?",
     "That's interesting! Tell me more about that.",
     "I'm still learning! Could you rephrase your question?",
     "Hmm, I'm not quite sure how to respond to that yet.",
     "I appreciate your message! Could you clarify what you'd like help with?"
-]
+)
 
 # Help text
 HELP_TEXT: str = """
@@ -81,12 +82,61 @@ I'm always learning and improving! 🚀
 """
 
 # News-related responses
-NEWS_RESPONSES: List[str] = [
+NEWS_RESPONSES: Tuple[str, ...] = (
     "I don't have access to real-time news, but I'm here to chat about anything else!",
     "I can't fetch live news updates, but feel free to share what's on your mind!",
     "News is constantly changing! I recommend checking a reliable news source for the latest updates.",
     "While I don't have current news access, I'm happy to discuss other topics!"
-]
+)
+
+
+class ResponsePool:
+    """
+    Pre-shuffled rotating pool of responses.
+
+    Drawing rotates the pool instead of calling the RNG, which is O(1) per
+    draw and guarantees no immediate repeats; the pool is reshuffled once
+    per full rotation so long sessions don't cycle predictably.
+    """
+
+    def __init__(self, responses: Tuple[str, ...]):
+        """
+        Initialize the pool from a sequence of responses.
+
+        Args:
+            responses: The responses to draw from
+        """
+        self._pool = deque(random.sample(responses, len(responses)))
+        self._remaining = len(responses)
+
+    def next(self) -> str:
+        """Return the next response, rotating the pool."""
+        response = self._pool[0]
+        self._pool.rotate(-1)
+        self._remaining -= 1
+        if self._remaining <= 0:
+            self._reshuffle(response)
+        return response
+
+    def _reshuffle(self, last: str):
+        """Reshuffle the pool, keeping the last draw away from the front."""
+        responses = list(self._pool)
+        random.shuffle(responses)
+        if len(responses) > 1 and responses[0] == last:
+            responses[0], responses[-1] = responses[-1], responses[0]
+        self._pool = deque(responses)
+        self._remaining = len(responses)
+
+
+# One pool per response category, built once at import time
+_POOLS = {
+    "weather_joke": ResponsePool(WEATHER_JOKES),
+    "weather_info": ResponsePool(WEATHER_CONDITIONS),
+    "general_joke": ResponsePool(GENERAL_JOKES),
+    "greeting": ResponsePool(GREETINGS),
+    "news": ResponsePool(NEWS_RESPONSES),
+    "default": ResponsePool(DEFAULT_RESPONSES),
+}
 
 
 class ResponseGenerator:
@@ -94,23 +144,23 @@ class ResponseGenerator:
 
     @staticmethod
     def get_weather_joke() -> str:
-        """Return a random weather joke."""
-        return random.choice(WEATHER_JOKES)
+        """Return a weather joke from the rotating pool."""
+        return _POOLS["weather_joke"].next()
 
     @staticmethod
     def get_weather_info() -> str:
-        """Return random weather information."""
-        return random.choice(WEATHER_CONDITIONS)
+        """Return weather information from the rotating pool."""
+        return _POOLS["weather_info"].next()
 
     @staticmethod
     def get_general_joke() -> str:
-        """Return a random general joke."""
-        return random.choice(GENERAL_JOKES)
+        """Return a general joke from the rotating pool."""
+        return _POOLS["general_joke"].next()
 
     @staticmethod
     def get_greeting() -> str:
-        """Return a random greeting."""
-        return random.choice(GREETINGS)
+        """Return a greeting from the rotating pool."""
+        return _POOLS["greeting"].next()
 
     @staticmethod
     def get_help_text() -> str:
@@ -119,10 +169,10 @@ class ResponseGenerator:
 
     @staticmethod
     def get_news_response() -> str:
-        """Return a news-related response."""
-        return random.choice(NEWS_RESPONSES)
+        """Return a news-related response from the rotating pool."""
+        return _POOLS["news"].next()
 
     @staticmethod
     def get_default_response() -> str:
-        """Return a random default/fallback response."""
-        return random.choice(DEFAULT_RESPONSES)
+        """Return a default/fallback response from the rotating pool."""
+        return _POOLS["default"].next()
@@ -20,30 +20,45 @@ class Config:
     # Web server configuration
     WEB_HOST: str = os.getenv('WEB_HOST', '0.0.0.0')
     WEB_PORT: int = int(os.getenv('WEB_PORT', '8080'))
+    WEB_THREADS: int = int(os.getenv('WEB_THREADS', '32'))
     DEBUG: bool = os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes')
     CORS_ORIGINS: str = os.getenv('CORS_ORIGINS', '*')
 
     # Message validation
     MAX_MESSAGE_LENGTH: int = int(os.getenv('MAX_MESSAGE_LENGTH', '5000'))
 
-    # Logging configuration
-    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
+    # Logging configuration (level normalized once at import)
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO').upper()
     LOG_FORMAT: str = os.getenv(
         'LOG_FORMAT',
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+    # Cached parse of CORS_ORIGINS; refreshed only when the raw value changes
+    _cors_origins_src: Optional[str] = None
+    _cors_origins_list: Optional[list] = None
+
     @classmethod
     def get_cors_origins(cls) -> list:
         """
         Parse CORS origins from configuration.
 
+        The parsed list is cached against the raw setting, so repeated calls
+        (e.g. per-request CORS checks) cost one string comparison instead of
+        re-splitting.
+
         Returns:
             list: List of allowed CORS origins
         """
-        if cls.CORS_ORIGINS == '*':
-            return ['*']
-        return [origin.strip() for origin in cls.CORS_ORIGINS.split(',')]
+        if cls.CORS_ORIGINS != cls._cors_origins_src:
+            cls._cors_origins_src = cls.CORS_ORIGINS
+            if cls.CORS_ORIGINS == '*':
+                cls._cors_origins_list = ['*']
+            else:
+                cls._cors_origins_list = [
+                    origin.strip() for origin in cls.CORS_ORIGINS.split(',')
+                ]
+        return cls._cors_origins_list
 
     @classmethod
     def validate(cls) -> bool:
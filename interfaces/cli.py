@@ -7,9 +7,11 @@ and conversation management.
 
 import asyncio
 import logging
+import threading
+from contextlib import contextmanager
 from typing import Optional
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
@@ -37,11 +39,51 @@ class CLIInterface:
         self.console = Console()
         self.running = False
 
+        # Static renderables, built lazily and reused across invocations so
+        # repeated help/welcome displays skip markup and markdown parsing
+        self._welcome_panel = None
+        self._help_group = None
+
+        # One reusable thinking indicator; building a Status per message
+        # re-parses the markup and rebuilds the spinner each time
+        self._thinking = self.console.status("[bold blue]Thinking...", spinner="dots")
+
+        # Command dispatch table; quit/exit are handled separately since
+        # they flip the run flag
+        self._commands = {
+            'help': self._show_help,
+            'status': self._show_status,
+            'history': self._show_history,
+            'clear': self._clear_history,
+        }
+
         logger.info("CLI interface initialized")
 
+    @contextmanager
+    def _sync_output(self):
+        """
+        Wrap batched writes in DEC mode 2026 synchronized-output marks.
+
+        Supporting terminals buffer everything between the marks and paint
+        once, so multi-panel dumps render atomically instead of tearing.
+        No-op when output isn't a terminal.
+        """
+        if not self.console.is_terminal:
+            yield
+            return
+        file = self.console.file
+        file.write('\x1b[?2026h')
+        file.flush()
+        try:
+            yield
+        finally:
+            file.write('\x1b[?2026l')
+            file.flush()
+
     def _show_welcome(self):
         """Display welcome message."""
-        welcome_text = f"""
+        if self._welcome_panel is None:
+            welcome_text = f"""
 # Welcome to {self.agent.name}!
 
 Version: {self.agent.version}
@@ -53,46 +95,49 @@ I'm here to help you with:
 - And more!
 
 Type 'help' for commands, or 'quit' to exit.
-        """
-
-        self.console.print(
-            Panel(
+            """
+            self._welcome_panel = Panel(
                 Markdown(welcome_text),
                 title="🤖 AI Assistant",
                 border_style="blue"
             )
-        )
-        self.console.print()
+
+        with self._sync_output():
+            self.console.print(self._welcome_panel)
+            self.console.print()
 
     def _show_help(self):
         """Display help information."""
-        help_table = Table(title="Available Commands", show_header=True)
-        help_table.add_column("Command", style="cyan")
-        help_table.add_column("Description", style="white")
-
-        commands = [
-            ("help", "Show this help message"),
-            ("status", "Show agent status"),
-            ("history", "Show conversation history"),
-            ("clear", "Clear conversation history"),
-            ("quit/exit", "Exit the application"),
-        ]
-
-        for cmd, desc in commands:
-            help_table.add_row(cmd, desc)
-
-        self.console.print(help_table)
-        self.console.print()
-
-        # Also show agent capabilities
-        self.console.print(
-            Panel(
-                self.agent.response_gen.get_help_text(),
-                title="💡 What I Can Do",
-                border_style="green"
+        if self._help_group is None:
+            help_table = Table(title="Available Commands", show_header=True)
+            help_table.add_column("Command", style="cyan")
+            help_table.add_column("Description", style="white")
+
+            commands = [
+                ("help", "Show this help message"),
+                ("status", "Show agent status"),
+                ("history", "Show conversation history"),
+                ("clear", "Clear conversation history"),
+                ("quit/exit", "Exit the application"),
+            ]
+
+            for cmd, desc in commands:
+                help_table.add_row(cmd, desc)
+
+            self._help_group = Group(
+                help_table,
+                "",
+                Panel(
+                    self.agent.response_gen.get_help_text(),
+                    title="💡 What I Can Do",
+                    border_style="green"
+                ),
+                ""
             )
-        )
-        self.console.print()
+
+        # Render the table and capabilities panel in one pass
+        with self._sync_output():
+            self.console.print(self._help_group)
 
     def _show_status(self):
         """Display agent status."""
@@ -108,18 +153,21 @@ Type 'help' for commands, or 'quit' to exit.
         status_table.add_row("Conversation Count", str(status['conversation_count']))
         status_table.add_row("Max History", str(status['max_history']))
 
-        self.console.print(
-            Panel(
-                status_table,
-                title="📊 Agent Status",
-                border_style="yellow"
+        with self._sync_output():
+            self.console.print(
+                Panel(
+                    status_table,
+                    title="📊 Agent Status",
+                    border_style="yellow"
+                )
             )
-        )
-        self.console.print()
+            self.console.print()
 
     def _show_history(self):
         """Display conversation history."""
-        history = self.agent.get_conversation_history(user_id=self.user_id)
+        # The agent's limit walks its store from the right, so this touches
+        # only the entries actually displayed
+        history = self.agent.get_conversation_history(user_id=self.user_id, limit=10)
 
         if not history:
             self.console.print(
@@ -127,25 +175,27 @@ Type 'help' for commands, or 'quit' to exit.
             )
             return
 
-        for entry in history[-10:]:  # Show last 10 entries
-            # User message
-            self.console.print(
+        # Build all panels first and render them in a single pass; one
+        # console.print per panel costs a full Rich render each
+        panels = []
+        for entry in history:
+            panels.append(
                 Panel(
                     entry['message'],
                     title=f"👤 You ({entry['timestamp'][:19]})",
                     border_style="blue"
                 )
             )
-
-            # Agent response
-            self.console.print(
+            panels.append(
                 Panel(
                     entry['response'],
                     title="🤖 Assistant",
                     border_style="green"
                 )
             )
-            self.console.print()
+            panels.append("")
+        with self._sync_output():
+            self.console.print(Group(*panels))
 
     def _clear_history(self):
         """Clear conversation history."""
@@ -154,10 +204,13 @@ Type 'help' for commands, or 'quit' to exit.
             "[green]✓ Conversation history cleared.[/green]\n"
         )
 
-    async def _handle_command(self, user_input: str) -> bool:
+    def _handle_command(self, user_input: str) -> bool:
         """
         Handle special commands.
 
+        Synchronous: no command awaits anything, so dispatching through a
+        coroutine only cost a frame per input line.
+
         Args:
             user_input: The user's input
 
@@ -166,24 +219,13 @@ Type 'help' for commands, or 'quit' to exit.
         """
         command = user_input.lower().strip()
 
-        if command in ['quit', 'exit']:
+        if command in ('quit', 'exit'):
             self.running = False
             return True
 
-        elif command == 'help':
-            self._show_help()
-            return True
-
-        elif command == 'status':
-            self._show_status()
-            return True
-
-        elif command == 'history':
-            self._show_history()
-            return True
-
-        elif command == 'clear':
-            self._clear_history()
+        handler = self._commands.get(command)
+        if handler is not None:
+            handler()
             return True
 
         return False
@@ -203,8 +245,8 @@ Type 'help' for commands, or 'quit' to exit.
                 self.console.print(f"[red]Error: {e}[/red]\n")
                 return
 
-            # Show processing indicator
-            with self.console.status("[bold blue]Thinking...", spinner="dots"):
+            # Show processing indicator (reused across messages)
+            with self._thinking:
                 response = await self.agent.process_message(message, self.user_id)
 
             # Display response
@@ -227,26 +269,44 @@ Type 'help' for commands, or 'quit' to exit.
             self.console.print()
 
         except Exception as e:
-            logger.error(f"Error processing message: {e}", exc_info=True)
+            logger.error("Error processing message: %s", e, exc_info=True)
             self.console.print(
                 f"[red]An error occurred: {e}[/red]\n"
             )
 
+    def _read_input(self):
+        """
+        Producer loop run on a daemon thread: feed lines into the input
+        queue so the user can type the next message while the agent is
+        still processing the previous one.
+        """
+        while self.running:
+            try:
+                line = Prompt.ask("\n[bold cyan]You[/bold cyan]")
+            except EOFError:
+                line = None
+            self._loop.call_soon_threadsafe(self._input_queue.put_nowait, line)
+            if line is None:
+                return
+
     async def _run_loop(self):
-        """Run the main conversation loop."""
+        """Run the main conversation loop, consuming the input queue."""
         while self.running:
             try:
-                # Get user input
-                user_input = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: Prompt.ask("\n[bold cyan]You[/bold cyan]")
-                )
+                user_input = await self._input_queue.get()
+
+                if user_input is None:  # EOF from the producer
+                    self.running = False
+                    break
 
-                if not user_input.strip():
+                # Strip once here so empty lines never reach validation and
+                # downstream code skips re-stripping
+                user_input = user_input.strip()
+                if not user_input:
                     continue
 
                 # Check if it's a command
-                is_command = await self._handle_command(user_input)
+                is_command = self._handle_command(user_input)
 
                 if not is_command:
                     # Process as a regular message
@@ -255,23 +315,27 @@ Type 'help' for commands, or 'quit' to exit.
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Interrupted. Type 'quit' to exit.[/yellow]")
                 continue
-            except EOFError:
-                self.running = False
-                break
             except Exception as e:
-                logger.error(f"Error in CLI loop: {e}", exc_info=True)
+                logger.error("Error in CLI loop: %s", e, exc_info=True)
                 self.console.print(f"[red]Error: {e}[/red]\n")
 
     async def start(self):
         """Start the CLI interface."""
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._input_queue = asyncio.Queue()
 
         try:
             self._show_welcome()
+            # Input is read on its own daemon thread so reading and
+            # processing overlap
+            threading.Thread(
+                target=self._read_input, name="cli-input", daemon=True
+            ).start()
             await self._run_loop()
 
         except Exception as e:
-            logger.error(f"CLI error: {e}", exc_info=True)
+            logger.error("CLI error: %s", e, exc_info=True)
             self.console.print(f"[red]Fatal error: {e}[/red]")
 
         finally:
@@ -6,10 +6,30 @@ through HTTP requests.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
-from flask import Flask, request, jsonify, render_template
-from flask_cors import CORS
+import threading
+import time
+from flask import Flask, request, render_template
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson  # C-accelerated JSON encoding (optional)
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so any code path that goes
+    through jsonify/get_json also hits the C encoder."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 from agent import AIAgent
 from config import Config
@@ -17,6 +37,11 @@ from utils.validators import validate_message, validate_user_id, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Template directory at the project root, resolved once at import
+_TEMPLATE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'templates')
+)
+
 
 class WebInterface:
     """Flask-based web interface for the AI Agent."""
@@ -30,42 +55,137 @@ class WebInterface:
         """
         self.agent = agent
         # Configure Flask to use templates from project root
-        template_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'templates'))
-        self.app = Flask(__name__, template_folder=template_dir)
-
-        # Configure CORS
-        CORS(self.app, origins=Config.get_cors_origins())
+        self.app = Flask(__name__, template_folder=_TEMPLATE_DIR)
+
+        # Bound request bodies: a chat payload is a message plus small
+        # location/context envelopes, so anything past this is rejected
+        # before the JSON decoder sees it
+        self.app.config['MAX_CONTENT_LENGTH'] = Config.MAX_MESSAGE_LENGTH * 4
+
+        # Route Flask's own JSON machinery through orjson as well, covering
+        # anything that bypasses the _json helper
+        if orjson is not None:
+            self.app.json = OrjsonProvider(self.app)
+
+        # Configure CORS: the origin set is static, so one frozenset probe
+        # per response replaces flask_cors's generic per-request matching
+        origins = Config.get_cors_origins()
+        self._cors_allow_all = '*' in origins
+        self._cors_allowed = frozenset(origins)
+        self.app.after_request(self._add_cors_headers)
+
+        # One persistent event loop on a daemon thread serves every request;
+        # building and tearing down a loop per request paid for a fresh
+        # selector and executor each time
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever, name="agent-loop", daemon=True
+        ).start()
+
+        # Short-TTL cache for agent status; load-balancer health checks and
+        # index renders hit it every second
+        self._status_cache = (0.0, None)
 
         # Register routes
         self._register_routes()
 
         logger.info("Web interface initialized")
 
+    def _cached_status(self, ttl: float = 0.5) -> dict:
+        """
+        Get the agent status, cached for a short TTL.
+
+        Args:
+            ttl: Maximum staleness in seconds
+
+        Returns:
+            dict: Agent status (possibly up to ttl seconds old)
+        """
+        now = time.monotonic()
+        cached_at, status = self._status_cache
+        if status is None or now - cached_at > ttl:
+            status = self.agent.get_status()
+            self._status_cache = (now, status)
+        return status
+
+    def _add_cors_headers(self, response):
+        """Attach CORS headers from the precomputed origin set."""
+        if self._cors_allow_all:
+            response.headers['Access-Control-Allow-Origin'] = '*'
+        else:
+            origin = request.headers.get('Origin')
+            if origin not in self._cors_allowed:
+                return response
+            response.headers['Access-Control-Allow-Origin'] = origin
+            response.vary.add('Origin')
+        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, DELETE, OPTIONS'
+        response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+        return response
+
+    def _json(self, obj, status: int = 200):
+        """
+        Build a JSON response, using orjson's C encoder when available.
+
+        Args:
+            obj: Object to serialize
+            status: HTTP status code
+
+        Returns:
+            Response: Flask response with application/json body
+        """
+        if orjson is not None:
+            body = orjson.dumps(obj)
+        else:
+            body = json.dumps(obj).encode('utf-8')
+        return self.app.response_class(body, status=status, mimetype='application/json')
+
     def _register_routes(self):
         """Register Flask routes."""
 
+        # The landing page depends only on the agent's immutable name and
+        # version, so render it once at boot and serve the bytes
+        with self.app.app_context():
+            index_html = render_template(
+                'index.html',
+                agent_name=self.agent.name,
+                agent_version=self.agent.version
+            ).encode('utf-8')
+        index_etag = '"%s"' % hashlib.sha1(index_html).hexdigest()
+
         @self.app.route('/', methods=['GET'])
         def index():
-            """Serve the main web interface."""
-            status = self.agent.get_status()
-            return render_template(
-                'index.html',
-                agent_name=status.get('name', 'AI Assistant'),
-                agent_version=status.get('version', '2.0.0')
-            )
+            """Serve the main web interface (prerendered at boot)."""
+            if request.headers.get('If-None-Match') == index_etag:
+                response = self.app.response_class(b'', status=304)
+            else:
+                response = self.app.response_class(index_html, mimetype='text/html')
+            response.headers['ETag'] = index_etag
+            return response
 
         @self.app.route('/api/health', methods=['GET'])
         def health():
             """Health check endpoint."""
-            return jsonify({
+            return self._json({
                 "status": "healthy",
-                "agent": self.agent.get_status()
+                "agent": self._cached_status()
             })
 
         @self.app.route('/api/status', methods=['GET'])
         def status():
             """Get agent status."""
-            return jsonify(self.agent.get_status())
+            agent_status = self.agent.get_status()
+            # Weak ETag over the fields that actually change, so noisy
+            # pollers get 0-byte 304s between conversations
+            etag = 'W/"%s-%s"' % (
+                agent_status['conversation_count'], agent_status['status']
+            )
+            if request.headers.get('If-None-Match') == etag:
+                response = self.app.response_class(b'', status=304)
+            else:
+                response = self._json(agent_status)
+            response.headers['ETag'] = etag
+            response.headers['Cache-Control'] = 'max-age=1'
+            return response
 
         @self.app.route('/api/chat', methods=['POST'])
         def chat():
@@ -88,13 +208,32 @@ class WebInterface:
             }
             """
             try:
-                # Get request data
-                data = request.get_json()
+                # Reject obviously-empty and oversized payloads before the
+                # decoder runs; the smallest valid body is "{...}". Chunked
+                # requests carry no Content-Length and fall through to the
+                # decoder, which rejects an empty body anyway.
+                content_length = request.content_length
+                if content_length is not None:
+                    if content_length < 2:
+                        return self._json({
+                            "error": "Invalid JSON body"
+                        }, 400)
+                    if content_length > self.app.config['MAX_CONTENT_LENGTH']:
+                        return self._json({
+                            "error": "Payload too large"
+                        }, 413)
+
+                # Decode the body directly (orjson when available)
+                try:
+                    raw = request.get_data(cache=False)
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                except Exception:
+                    data = None
 
                 if not data:
-                    return jsonify({
+                    return self._json({
                         "error": "Invalid JSON body"
-                    }), 400
+                    }, 400)
 
                 message = data.get('message', '')
                 user_id = data.get('user_id', 'default')
@@ -106,28 +245,25 @@ class WebInterface:
                     _, message = validate_message(message)
                     _, user_id = validate_user_id(user_id)
                 except ValidationError as e:
-                    return jsonify({
+                    return self._json({
                         "error": str(e)
-                    }), 400
+                    }, 400)
 
-                # Process message using asyncio
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    response = loop.run_until_complete(
-                        self.agent.process_message(message, user_id, location=location, context=context)
-                    )
-                finally:
-                    loop.close()
+                # Run the coroutine on the shared background loop
+                future = asyncio.run_coroutine_threadsafe(
+                    self.agent.process_message(message, user_id, location=location, context=context),
+                    self._loop
+                )
+                response = future.result()
 
-                return jsonify(response)
+                return self._json(response)
 
             except Exception as e:
-                logger.error(f"Error in chat endpoint: {e}", exc_info=True)
-                return jsonify({
+                logger.error("Error in chat endpoint: %s", e, exc_info=True)
+                return self._json({
                     "error": "Internal server error",
                     "message": str(e)
-                }), 500
+                }, 500)
 
         @self.app.route('/api/history', methods=['GET'])
         def history():
@@ -147,25 +283,38 @@ class WebInterface:
                     try:
                         _, user_id = validate_user_id(user_id)
                     except ValidationError as e:
-                        return jsonify({
+                        return self._json({
                             "error": str(e)
-                        }), 400
+                        }, 400)
 
                 history_data = self.agent.get_conversation_history(
                     user_id=user_id,
                     limit=limit
                 )
 
-                return jsonify({
-                    "history": history_data,
-                    "count": len(history_data)
-                })
+                # Stream the entries one encoded chunk at a time so large
+                # histories never materialize as a single JSON string and
+                # the socket fills while encoding continues
+                def generate():
+                    yield b'{"count":%d,"history":[' % len(history_data)
+                    first = True
+                    for entry in history_data:
+                        if not first:
+                            yield b','
+                        first = False
+                        if orjson is not None:
+                            yield orjson.dumps(entry)
+                        else:
+                            yield json.dumps(entry).encode('utf-8')
+                    yield b']}'
+
+                return self.app.response_class(generate(), mimetype='application/json')
 
             except Exception as e:
-                logger.error(f"Error in history endpoint: {e}", exc_info=True)
-                return jsonify({
+                logger.error("Error in history endpoint: %s", e, exc_info=True)
+                return self._json({
                     "error": "Internal server error"
-                }), 500
+                }, 500)
 
         @self.app.route('/api/history', methods=['DELETE'])
         def clear_history():
@@ -183,37 +332,37 @@ class WebInterface:
                     try:
                         _, user_id = validate_user_id(user_id)
                     except ValidationError as e:
-                        return jsonify({
+                        return self._json({
                             "error": str(e)
-                        }), 400
+                        }, 400)
 
                 self.agent.clear_history(user_id=user_id)
 
-                return jsonify({
+                return self._json({
                     "message": "History cleared successfully",
                     "user_id": user_id if user_id else "all"
                 })
 
             except Exception as e:
-                logger.error(f"Error clearing history: {e}", exc_info=True)
-                return jsonify({
+                logger.error("Error clearing history: %s", e, exc_info=True)
+                return self._json({
                     "error": "Internal server error"
-                }), 500
+                }, 500)
 
         @self.app.errorhandler(404)
         def not_found(error):
             """Handle 404 errors."""
-            return jsonify({
+            return self._json({
                 "error": "Endpoint not found"
-            }), 404
+            }, 404)
 
         @self.app.errorhandler(500)
         def internal_error(error):
             """Handle 500 errors."""
-            logger.error(f"Internal server error: {error}", exc_info=True)
-            return jsonify({
+            logger.error("Internal server error: %s", error, exc_info=True)
+            return self._json({
                 "error": "Internal server error"
-            }), 500
+            }, 500)
 
     def run(self, host: str = None, port: int = None, debug: bool = None):
         """
@@ -228,8 +377,28 @@ class WebInterface:
         port = port or Config.WEB_PORT
         debug = debug if debug is not None else Config.DEBUG
 
-        logger.info(f"Starting web server on {host}:{port}")
-        logger.info(f"Debug mode: {debug}")
+        logger.info("Starting web server on %s:%s", host, port)
+        logger.info("Debug mode: %s", debug)
+
+        if not debug:
+            # Serve behind waitress (bounded thread pool) in production; the
+            # Werkzeug dev server serializes requests
+            try:
+                from waitress import serve
+            except ImportError:
+                logger.warning(
+                    "waitress not installed; falling back to the Flask dev server"
+                )
+            else:
+                serve(
+                    self.app,
+                    host=host,
+                    port=port,
+                    threads=Config.WEB_THREADS,
+                    connection_limit=1000,
+                    channel_timeout=120
+                )
+                return
 
         self.app.run(
             host=host,
@@ -115,9 +115,10 @@ def main():
     try:
         Config.validate()
         logger.info("Configuration validated successfully")
-        logger.debug(f"Config summary: {Config.summary()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Config summary: %s", Config.summary())
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         print(f"\nConfiguration Error: {e}\n")
         sys.exit(1)
 
@@ -149,7 +150,7 @@ def main():
         sys.exit(0)
 
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         print(f"\nFatal Error: {e}\n")
         sys.exit(1)
 
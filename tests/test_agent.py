@@ -4,6 +4,7 @@ Tests for the AI Agent core functionality.
 
 import pytest
 from agent import AIAgent
+from agent.base import ConversationHistory
 from agent.responses import ResponseGenerator
 
 
@@ -132,6 +133,51 @@ class TestAIAgent:
             await agent.process_message(None, "test-user")
 
 
+class TestConversationHistory:
+    """Test cases for the ConversationHistory store."""
+
+    def test_eviction_respects_maxlen(self):
+        """Test that the store evicts oldest entries when full."""
+        history = ConversationHistory(maxlen=3)
+        for i in range(5):
+            history.append(f"t{i}", "user", f"msg{i}", f"resp{i}")
+
+        assert len(history) == 3
+        assert [e["message"] for e in history.entries()] == ["msg2", "msg3", "msg4"]
+
+    def test_user_filter_survives_eviction(self):
+        """Test that the per-user index stays correct across eviction."""
+        history = ConversationHistory(maxlen=3)
+        for i in range(5):
+            history.append(f"t{i}", f"user{i % 2}", f"msg{i}", f"resp{i}")
+
+        assert [e["message"] for e in history.entries_for_user("user0")] == ["msg2", "msg4"]
+        assert [e["message"] for e in history.entries_for_user("user1")] == ["msg3"]
+        assert history.entries_for_user("unknown") == []
+
+    def test_limits(self):
+        """Test limited reads return the newest entries in order."""
+        history = ConversationHistory(maxlen=10)
+        for i in range(5):
+            history.append(f"t{i}", "user", f"msg{i}", f"resp{i}")
+
+        assert [e["message"] for e in history.entries(limit=2)] == ["msg3", "msg4"]
+        assert [e["message"] for e in history.entries_for_user("user", limit=2)] == ["msg3", "msg4"]
+
+    def test_remove_user(self):
+        """Test removing one user's entries keeps the rest in order."""
+        history = ConversationHistory(maxlen=10)
+        for i in range(4):
+            history.append(f"t{i}", f"user{i % 2}", f"msg{i}", f"resp{i}")
+
+        history.remove_user("user0")
+        assert [e["message"] for e in history.entries()] == ["msg1", "msg3"]
+
+        # Appends after removal keep the index consistent
+        history.append("t4", "user0", "msg4", "resp4")
+        assert [e["message"] for e in history.entries_for_user("user0")] == ["msg4"]
+
+
 class TestResponseGenerator:
     """Test cases for ResponseGenerator class."""
 
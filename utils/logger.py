@@ -4,21 +4,42 @@ Logging configuration for the AI Agent.
 This module sets up structured logging with configurable levels and formats.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 from config import Config
 
+# Background listener that drains the log queue; replaced if setup_logging
+# runs again
+_queue_listener: Optional[QueueListener] = None
+_atexit_registered = False
+
+
+def _stop_queue_listener() -> None:
+    """Stop the active queue listener, if any (idempotent)."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 
 def setup_logging(level: Optional[str] = None, log_file: Optional[str] = None) -> None:
     """
     Set up logging configuration for the application.
 
+    Records are routed through a queue to a background listener thread, so
+    emitting a log never blocks a request handler on console or file I/O.
+
     Args:
         level: Optional log level override (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path to write logs to
     """
+    global _queue_listener
+
     log_level = level or Config.LOG_LEVEL
     log_format = Config.LOG_FORMAT
 
@@ -32,20 +53,36 @@ def setup_logging(level: Optional[str] = None, log_file: Optional[str] = None) -
     # Remove existing handlers
     root_logger.handlers.clear()
 
+    # One formatter shared by every handler
+    formatter = logging.Formatter(log_format)
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
-    console_formatter = logging.Formatter(log_format)
-    console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
 
-    # File handler (optional)
+    # File handler (optional); rotating, and delay=True defers the open
+    # until the first record actually reaches it
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=10 * 1024 * 1024, backupCount=3, delay=True
+        )
         file_handler.setLevel(numeric_level)
-        file_formatter = logging.Formatter(log_format)
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    # Emit into a queue; the listener thread does the actual I/O. One
+    # idempotent atexit hook drains whichever listener is active at exit.
+    global _atexit_registered
+    _stop_queue_listener()
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    if not _atexit_registered:
+        atexit.register(_stop_queue_listener)
+        _atexit_registered = True
 
     # Set third-party library log levels to reduce noise
     logging.getLogger('werkzeug').setLevel(logging.WARNING)
@@ -5,22 +5,50 @@ This module provides functionality to fetch current weather conditions
 from external weather APIs.
 """
 
+import asyncio
 import logging
 import os
+import random
 import re
-from typing import Dict, Optional, Tuple
+import ssl
+import time
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
 import aiohttp
+from yarl import URL
+
+try:
+    import orjson  # C-accelerated JSON parsing (optional)
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Dedicated RNG for joke selection; avoids the shared module-level
+# Random's global state
+_RNG = random.Random()
+
+# wttr.in endpoint pieces, parsed once; format=j1 returns JSON
+_WTTR_BASE = URL("https://wttr.in")
+_WTTR_PARAMS = {"format": "j1"}
+
+# Relaxed SSL context for wttr.in, built once; create_default_context
+# reloads the system trust store from disk on every call
+_WTTR_SSL = ssl.create_default_context()
+_WTTR_SSL.check_hostname = False
+_WTTR_SSL.verify_mode = ssl.CERT_NONE
+
 # Default location: Queens, NY
 DEFAULT_LOCATION = "Queens,NY,US"
 DEFAULT_LAT = 40.7282
 DEFAULT_LON = -73.7949
 
-# Known location coordinates for better accuracy
+# Known location coordinates for better accuracy, wrapped read-only so
+# the shared table can't be mutated at runtime
 # Note: More specific locations (neighborhoods) should be checked first
-LOCATION_COORDINATES = {
+LOCATION_COORDINATES = MappingProxyType({
     # Specific neighborhoods (check these first for accuracy)
     "little neck,ny": (40.7756, -73.7400),
     "little neck": (40.7756, -73.7400),
@@ -40,12 +68,138 @@ LOCATION_COORDINATES = {
     # General city (check last to avoid overriding specific neighborhoods)
     "new york,ny": (40.7128, -74.0060),  # Manhattan coordinates
     "new york": (40.7128, -74.0060),
+})
+
+
+# Canned weather served when every upstream source fails; read-only, the
+# accessor hands out copies
+_FALLBACK_WEATHER = MappingProxyType({
+    "temperature_f": 72,
+    "temperature_c": 22,
+    "feels_like_f": 72,
+    "condition": "Clear",
+    "description": "Clear sky",
+    "humidity": 50,
+    "wind_speed": 5,
+    "location": "Queens, NY"
+})
+
+# Weather joke templates; only the chosen one is formatted per call,
+# instead of eagerly building all six candidate strings
+_JOKE_TEMPLATES = (
+    "The meteorologist's favorite type of music? Heavy metal - especially when it's hailing! Currently in {location}: {temp}°F with {desc}! {emoji}",
+    "Why do clouds never get lonely? Because they're always in good company - they're quite the cumulus crowd! Right now in {location} it's {temp}°F with {desc}! {emoji}",
+    "What did the barometric pressure say to the thermometer? 'I'm feeling quite under pressure today, but you seem to be rising to the occasion!' In {location}: {temp}°F with {desc}! {emoji}",
+    "The wind's favorite type of literature? Gust-ave Flaubert novels, naturally! Today in {location}: {temp}°F with {desc} and light winds! {emoji}",
+    "Why did the dew point become a philosopher? Because it was always questioning the humidity of existence! Current conditions in {location}: {temp}°F with {desc}! {emoji}",
+    "What's a tornado's favorite dance? The twist, obviously! But don't worry, in {location} it's just {temp}°F with {desc}! {emoji}",
+)
+
+# Weather emoji mapping, shared by every formatted response
+_EMOJI_MAP = {
+    "Clear": "☀️",
+    "Clouds": "☁️",
+    "Rain": "🌧️",
+    "Drizzle": "🌦️",
+    "Thunderstorm": "⛈️",
+    "Snow": "❄️",
+    "Mist": "🌫️",
+    "Fog": "🌫️",
+    "Haze": "🌫️"
+}
+_DEFAULT_EMOJI = "🌤️"
+
+# Location-extraction patterns, compiled once at import. Order matters:
+# "weather in/at/for [location]" forms are tried before "[location] weather".
+# The old verb-prefixed variant ("what's ... weather in X") always captured
+# the same text as the verb-less form, so one pattern covers both.
+# The message is lowercased before matching, so the patterns are compiled
+# without IGNORECASE (case-folding costs per compared character).
+_LOCATION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # Match "weather in/at/for [location]" - capture everything until end or weather/joke keyword
+    # This handles: "What's the weather in Queens, NY?" or "weather in Queens, NY"
+    r'weather\s+(?:in|at|for)\s+([^?!]*?)(?:\s+(?:weather|joke)|[?!]|$)',
+    # Match "[location] weather" - capture everything before "weather"
+    r'(.+?)\s+weather',
+    # Match "weather in/at/for [location]" to end of string
+    r'weather\s+(?:in|at|for)\s+(.+?)$',
+))
+
+# Cleanup patterns applied to the captured location
+_CLEANUP_WORDS_RE = re.compile(r'\s+(weather|joke|like|today|now|current)')
+_COMMA_WS_RE = re.compile(r',\s+')
+
+# Shared empty row for wttr payload defaults; the inline [{}] defaults
+# allocated a fresh list and dict per field per response
+_EMPTY_ROW = ({},)
+
+# wttr.in weather descriptions mapped to our condition classes; the
+# alternation finds the class in one scan (longer phrases first so
+# "partly cloudy" wins over "cloudy" at the same position)
+_WTTR_CONDITION_RE = re.compile(
+    r'partly cloudy|light rain|moderate rain|heavy rain|'
+    r'light snow|moderate snow|heavy snow|'
+    r'sunny|clear|cloudy|overcast|mist|fog'
+)
+_WTTR_CONDITION_MAP = {
+    "sunny": "Clear",
+    "clear": "Clear",
+    "partly cloudy": "Clouds",
+    "cloudy": "Clouds",
+    "overcast": "Clouds",
+    "mist": "Mist",
+    "fog": "Fog",
+    "light rain": "Rain",
+    "moderate rain": "Rain",
+    "heavy rain": "Rain",
+    "light snow": "Snow",
+    "moderate snow": "Snow",
+    "heavy snow": "Snow",
+}
+
+# Canonical display names for the known locations, keyed like
+# LOCATION_COORDINATES (both "city,st" and bare forms)
+_DISPLAY_NAMES = {
+    "little neck,ny": "Little Neck, NY",
+    "little neck": "Little Neck, NY",
+    "huntington,ny": "Huntington, NY",
+    "huntington": "Huntington, NY",
+    "queens,ny": "Queens, NY",
+    "queens": "Queens, NY",
+    "manhattan,ny": "Manhattan, NY",
+    "manhattan": "Manhattan, NY",
+    "brooklyn,ny": "Brooklyn, NY",
+    "brooklyn": "Brooklyn, NY",
+    "bronx,ny": "Bronx, NY",
+    "bronx": "Bronx, NY",
+    "staten island,ny": "Staten Island, NY",
+    "staten island": "Staten Island, NY",
+    "new york,ny": "New York, NY",
+    "new york": "New York, NY",
 }
 
 
+def _display_name_for(location: str) -> Optional[str]:
+    """
+    Map a requested location to its canonical display name, if known.
+
+    Two hash probes (full normalized form, then the bare city before the
+    comma) replace the old eight-branch if/elif cascades.
+    """
+    location_normalized = _COMMA_WS_RE.sub(',', location.lower().strip())
+    display = _DISPLAY_NAMES.get(location_normalized)
+    if display is None:
+        display = _DISPLAY_NAMES.get(location_normalized.partition(',')[0].strip())
+    return display
+
+
+@lru_cache(maxsize=1024)
 def parse_location_from_message(message: str) -> Optional[str]:
     """
     Parse location from a user message.
+
+    Pure function over the message text and memoized, since users repeat
+    the same phrasings across a session.
     
     Looks for patterns like:
     - "weather in [location]"
@@ -60,33 +214,28 @@ def parse_location_from_message(message: str) -> Optional[str]:
         str: Parsed location string, or None if no location found
     """
     message_lower = message.lower()
-    
-    # Patterns to match location - improved to handle commas and state abbreviations
-    # Try to match "weather in/at/for [location]" first, then "[location] weather"
-    patterns = [
-        # Match "weather in/at/for [location]" - capture everything until end or weather/joke keyword
-        # This handles: "What's the weather in Queens, NY?" or "weather in Queens, NY"
-        r'(?:what\'?s|what|tell|show|get).*?weather\s+(?:in|at|for)\s+([^?!]*?)(?:\s+(?:weather|joke)|[?!]|$)',
-        r'weather\s+(?:in|at|for)\s+([^?!]*?)(?:\s+(?:weather|joke)|[?!]|$)',
-        # Match "[location] weather" - capture everything before "weather"
-        r'(.+?)\s+weather',
-        # Match "weather in/at/for [location]" to end of string
-        r'weather\s+(?:in|at|for)\s+(.+?)$',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, message_lower, re.IGNORECASE)
+
+    # Every pattern requires the literal "weather"; a C-level substring
+    # check bails out long before the regex engine runs
+    if 'weather' not in message_lower:
+        return None
+
+    for pattern in _LOCATION_PATTERNS:
+        match = pattern.search(message_lower)
         if match:
             location = match.group(1).strip()
             # Clean up common words
-            location = re.sub(r'\s+(weather|joke|like|today|now|current)', '', location, flags=re.IGNORECASE)
+            location = _CLEANUP_WORDS_RE.sub('', location)
             location = location.strip()
-            
+
             # Remove trailing punctuation
             location = location.rstrip('.,!?')
-            
-            # Normalize location format: "Queens, NY" -> "Queens,NY" for API compatibility
-            location = re.sub(r',\s+', ',', location)  # Remove space after comma
+
+            # Normalize location format: "Queens, NY" -> "Queens,NY" for API
+            # compatibility; most captures have no comma at all, so a C-level
+            # contains check gates the regex engine
+            if ',' in location:
+                location = _COMMA_WS_RE.sub(',', location)  # Remove space after comma
             
             # Skip if location is too short or common words
             if len(location) > 2 and location not in ['the', 'a', 'an', 'what', 'how', 'tell', 'me', 'is', 'it']:
@@ -98,6 +247,18 @@ def parse_location_from_message(message: str) -> Optional[str]:
 class WeatherService:
     """Service for fetching weather data from OpenWeatherMap API."""
 
+    # Fixed layout: no per-instance __dict__, slightly faster attribute
+    # access, and typos on assignment fail loudly
+    __slots__ = ("api_key", "base_url", "_base_url", "_session", "_cache")
+
+    # Successful lookups are cached this long; weather doesn't meaningfully
+    # change between back-to-back requests
+    CACHE_TTL_SECONDS = 600
+    CACHE_MAX_ENTRIES = 256
+
+    # How long OpenWeatherMap gets before a wttr.in hedge request is fired
+    HEDGE_DELAY_SECONDS = 1.5
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the weather service.
@@ -107,6 +268,51 @@ class WeatherService:
         """
         self.api_key = api_key or os.getenv("OPENWEATHER_API_KEY")
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        # Prebuilt yarl URL; queries are attached with sorted keys so any
+        # edge cache in front of the API sees one canonical key per lookup
+        self._base_url = URL(self.base_url)
+        # Shared keep-alive session, created lazily so it binds to the
+        # running event loop; per-call sessions paid a TCP+TLS handshake
+        # on every weather lookup
+        self._session: Optional[aiohttp.ClientSession] = None
+        # TTL cache of parsed weather keyed by coordinates or normalized
+        # city; entries are (fetched_at, data)
+        self._cache: Dict = {}
+
+    def _cache_get(self, key) -> Optional[Dict]:
+        """Return cached weather for key if present and fresh."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        fetched_at, weather_data = entry
+        if time.monotonic() - fetched_at >= self.CACHE_TTL_SECONDS:
+            del self._cache[key]
+            return None
+        # Copy: callers overwrite the display location
+        return dict(weather_data)
+
+    def _cache_put(self, key, weather_data: Dict):
+        """Cache a successful lookup, evicting the oldest entry when full."""
+        if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.monotonic(), dict(weather_data))
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=5, connect=3),
+                connector=aiohttp.TCPConnector(
+                    limit=20, keepalive_timeout=75, ttl_dns_cache=300
+                )
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session, if one was created."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def get_weather(self, city: str = DEFAULT_LOCATION,
                          lat: Optional[float] = None,
@@ -132,56 +338,118 @@ class WeatherService:
         # Check if we have coordinates for this location
         # Normalize city name for lookup (remove spaces after commas, lowercase)
         city_normalized = city.lower().strip()
-        city_normalized = re.sub(r',\s+', ',', city_normalized)  # "Little Neck, NY" -> "little neck,ny"
+        city_normalized = _COMMA_WS_RE.sub(',', city_normalized)  # "Little Neck, NY" -> "little neck,ny"
         
-        # Try exact match first
-        if city_normalized in LOCATION_COORDINATES:
-            lat, lon = LOCATION_COORDINATES[city_normalized]
+        # Try the exact normalized form, then the bare city before the comma
+        # (partition avoids the list allocation of split); each form costs a
+        # single dict probe
+        coordinates = LOCATION_COORDINATES.get(city_normalized)
+        if coordinates is None:
+            coordinates = LOCATION_COORDINATES.get(city_normalized.partition(',')[0].strip())
+        if coordinates is not None:
+            lat, lon = coordinates
             logger.debug(f"Using known coordinates for {city}: {lat}, {lon}")
-        else:
-            # Try matching without state abbreviation
-            city_no_state = city_normalized.split(',')[0].strip()
-            if city_no_state in LOCATION_COORDINATES:
-                lat, lon = LOCATION_COORDINATES[city_no_state]
-                logger.debug(f"Using known coordinates for {city_no_state}: {lat}, {lon}")
-        
+
+        # Serve recent lookups from the TTL cache before touching the network
+        cache_key = (round(lat, 2), round(lon, 2)) if lat is not None and lon is not None else city_normalized
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug(f"Weather cache hit for {cache_key}")
+            return cached
+
         # Try OpenWeatherMap API first if key is available
         if self.api_key:
-            try:
-                # Build query parameters
-                params = {
-                    "appid": self.api_key,
-                    "units": "imperial"  # Get Fahrenheit
-                }
-
-                # Use coordinates if provided, otherwise use city name
-                if lat and lon:
-                    params["lat"] = lat
-                    params["lon"] = lon
-                    logger.debug(f"Fetching weather using coordinates: {lat}, {lon}")
+            # Build query parameters
+            params = {
+                "appid": self.api_key,
+                "units": "imperial"  # Get Fahrenheit
+            }
+
+            # Use coordinates if provided, otherwise use city name
+            if lat is not None and lon is not None:
+                params["lat"] = lat
+                params["lon"] = lon
+                logger.debug(f"Fetching weather using coordinates: {lat}, {lon}")
+            else:
+                # Normalize city format - ensure it's in the right format for API
+                params["q"] = city
+                logger.debug(f"Fetching weather for: {city}")
+
+            owm_task = asyncio.ensure_future(self._fetch_from_owm(params, city))
+            # Give OpenWeatherMap a head start before hedging
+            done, _ = await asyncio.wait({owm_task}, timeout=self.HEDGE_DELAY_SECONDS)
+
+            if done:
+                try:
+                    weather_data = owm_task.result()
+                except Exception as e:
+                    logger.warning(f"Error fetching from OpenWeatherMap: {e}, falling back to wttr.in")
                 else:
-                    # Normalize city format - ensure it's in the right format for API
-                    params["q"] = city
-                    logger.debug(f"Fetching weather for: {city}")
-
-                # Fetch weather data with optimized timeout
-                timeout = aiohttp.ClientTimeout(total=5, connect=3)  # Faster timeout
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(self.base_url, params=params, timeout=timeout) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            return self._parse_weather_data(data, city)
-                        else:
-                            logger.warning(f"OpenWeatherMap API error: {response.status}, falling back to wttr.in")
-            except Exception as e:
-                logger.warning(f"Error fetching from OpenWeatherMap: {e}, falling back to wttr.in")
-        
+                    self._cache_put(cache_key, weather_data)
+                    return weather_data
+            else:
+                # OpenWeatherMap is slow: hedge with wttr.in and take
+                # whichever source answers first
+                wttr_task = asyncio.ensure_future(self._fetch_from_wttr(city, lat, lon))
+                hedged = [owm_task, wttr_task]
+                weather_data = None
+                for completed in asyncio.as_completed(hedged):
+                    try:
+                        weather_data = await completed
+                        break
+                    except Exception as e:
+                        logger.warning(f"Hedged weather fetch failed: {e}")
+                for task in hedged:
+                    task.cancel()
+                if weather_data is None:
+                    return self._get_fallback_weather()
+                self._cache_put(cache_key, weather_data)
+                return weather_data
+
         # Fallback to wttr.in (free, no API key required)
         try:
-            return await self._fetch_from_wttr(city, lat, lon)
+            weather_data = await self._fetch_from_wttr(city, lat, lon)
         except Exception as e:
             logger.error(f"Error fetching weather from wttr.in: {e}", exc_info=True)
+            # Transient failures are not cached
             return self._get_fallback_weather()
+        self._cache_put(cache_key, weather_data)
+        return weather_data
+
+    async def _fetch_from_owm(self, params: Dict, city: str) -> Dict:
+        """Fetch and parse current weather from OpenWeatherMap."""
+        # Deterministic query-string order over the shared session
+        url = self._base_url.with_query(sorted(params.items()))
+        session = await self._get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise Exception(f"OpenWeatherMap returned status {response.status}")
+            # orjson parses the raw bytes directly, skipping the
+            # decode-to-str pass of the stdlib parser
+            if orjson is not None:
+                data = orjson.loads(await response.read())
+            else:
+                data = await response.json()
+            return self._parse_weather_data(data, city)
+
+    async def get_weather_many(self, cities: List[str]) -> List:
+        """
+        Get current weather for several locations concurrently.
+
+        All lookups share the keep-alive session and run under one gather,
+        so total wall time is the slowest lookup instead of the sum.
+
+        Args:
+            cities: City names to look up
+
+        Returns:
+            list: Weather dicts in input order; a failed lookup yields its
+                exception instead of aborting the batch
+        """
+        return await asyncio.gather(
+            *(self.get_weather(city) for city in cities),
+            return_exceptions=True
+        )
 
     def _parse_weather_data(self, data: Dict, location: str) -> Dict:
         """Parse OpenWeatherMap API response."""
@@ -191,29 +459,8 @@ class WeatherService:
 
         # Format the location name based on what was requested
         # This ensures we use the correct location name even if API returns something else
-        location_lower = location.lower().strip()
-        location_normalized = re.sub(r',\s+', ',', location_lower)
-        
-        # Format the location name properly (prioritize specific neighborhoods)
-        display_location = None
-        if location_normalized in LOCATION_COORDINATES or location_lower.split(',')[0].strip() in LOCATION_COORDINATES:
-            if location_normalized in ["little neck,ny", "little neck"] or location_lower.startswith("little neck"):
-                display_location = "Little Neck, NY"
-            elif location_normalized in ["huntington,ny", "huntington"] or location_lower.startswith("huntington"):
-                display_location = "Huntington, NY"
-            elif location_normalized in ["queens,ny", "queens"] or location_lower.startswith("queens"):
-                display_location = "Queens, NY"
-            elif location_normalized in ["manhattan,ny", "manhattan"] or location_lower.startswith("manhattan"):
-                display_location = "Manhattan, NY"
-            elif location_normalized in ["brooklyn,ny", "brooklyn"] or location_lower.startswith("brooklyn"):
-                display_location = "Brooklyn, NY"
-            elif location_normalized in ["bronx,ny", "bronx"] or location_lower.startswith("bronx"):
-                display_location = "Bronx, NY"
-            elif location_normalized in ["staten island,ny", "staten island"] or location_lower.startswith("staten island"):
-                display_location = "Staten Island, NY"
-            elif location_normalized in ["new york,ny", "new york"] or location_lower.startswith("new york"):
-                display_location = "New York, NY"
-        
+        display_location = _display_name_for(location)
+
         # If we couldn't format it, use API's returned name or the original location
         if not display_location:
             api_location_name = data.get("name", "")
@@ -226,9 +473,11 @@ class WeatherService:
                 # This shouldn't happen often, but handle gracefully
                 display_location = "Unknown Location"
 
+        # Bind each field once; temp feeds both unit conversions
+        temp_f = main.get("temp", 70)
         return {
-            "temperature_f": round(main.get("temp", 70)),
-            "temperature_c": round((main.get("temp", 70) - 32) * 5 / 9),
+            "temperature_f": round(temp_f),
+            "temperature_c": round((temp_f - 32) * 5 / 9),
             "feels_like_f": round(main.get("feels_like", 70)),
             "condition": weather.get("main", "Clear"),
             "description": weather.get("description", "clear sky").title(),
@@ -240,10 +489,9 @@ class WeatherService:
     async def _fetch_from_wttr(self, city: str, lat: Optional[float] = None, 
                                lon: Optional[float] = None) -> Dict:
         """Fetch weather from wttr.in (free, no API key required)."""
-        import ssl
         try:
             # Format location for wttr.in
-            if lat and lon:
+            if lat is not None and lon is not None:
                 # Use coordinates for more accurate results
                 location_query = f"{lat},{lon}"
             else:
@@ -251,24 +499,21 @@ class WeatherService:
                 # Remove spaces and format as "City,State" or "City,State,Country"
                 location_query = city.replace(" ", "")
             
-            # wttr.in API endpoint - format=j1 returns JSON
-            url = f"https://wttr.in/{location_query}?format=j1"
-            
-            # Create SSL context that doesn't verify certificates
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Use shorter timeout for faster response
-            connector = aiohttp.TCPConnector(ssl=ssl_context, limit=10)
-            timeout = aiohttp.ClientTimeout(total=5, connect=3)  # Reduced from 10s to 5s
-            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                async with session.get(url, timeout=timeout) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._parse_wttr_data(data, city, lat, lon)
+            # Build from the pre-parsed base instead of re-parsing a string URL
+            url = _WTTR_BASE / location_query
+
+            # Reuse the shared session; the relaxed SSL policy applies
+            # per-request rather than through a dedicated connector
+            session = await self._get_session()
+            async with session.get(url, params=_WTTR_PARAMS, ssl=_WTTR_SSL) as response:
+                if response.status == 200:
+                    if orjson is not None:
+                        data = orjson.loads(await response.read())
                     else:
-                        raise Exception(f"wttr.in returned status {response.status}")
+                        data = await response.json()
+                    return self._parse_wttr_data(data, city, lat, lon)
+                else:
+                    raise Exception(f"wttr.in returned status {response.status}")
         except Exception as e:
             logger.error(f"Error fetching from wttr.in: {e}")
             raise
@@ -277,38 +522,16 @@ class WeatherService:
                         lon: Optional[float] = None) -> Dict:
         """Parse wttr.in API response."""
         try:
-            current = data.get("current_condition", [{}])[0]
-            location_info = data.get("nearest_area", [{}])[0]
-            
+            current = (data.get("current_condition") or _EMPTY_ROW)[0]
+            location_info = (data.get("nearest_area") or _EMPTY_ROW)[0]
+
             # Get location name
-            area_name = location_info.get("areaName", [{}])[0].get("value", "")
-            region = location_info.get("region", [{}])[0].get("value", "")
-            country = location_info.get("country", [{}])[0].get("value", "")
+            area_name = (location_info.get("areaName") or _EMPTY_ROW)[0].get("value", "")
+            region = (location_info.get("region") or _EMPTY_ROW)[0].get("value", "")
             
             # Format location name based on requested city (prioritize our database over API response)
-            city_lower = city.lower().strip()
-            city_normalized = re.sub(r',\s+', ',', city_lower)
-            
-            # Check if we have this location in our database (prioritize specific neighborhoods)
-            location_name = None
-            if city_normalized in LOCATION_COORDINATES or city_lower.split(',')[0].strip() in LOCATION_COORDINATES:
-                if city_normalized in ["little neck,ny", "little neck"] or city_lower.startswith("little neck"):
-                    location_name = "Little Neck, NY"
-                elif city_normalized in ["huntington,ny", "huntington"] or city_lower.startswith("huntington"):
-                    location_name = "Huntington, NY"
-                elif city_normalized in ["queens,ny", "queens"] or city_lower.startswith("queens"):
-                    location_name = "Queens, NY"
-                elif city_normalized in ["manhattan,ny", "manhattan"] or city_lower.startswith("manhattan"):
-                    location_name = "Manhattan, NY"
-                elif city_normalized in ["brooklyn,ny", "brooklyn"] or city_lower.startswith("brooklyn"):
-                    location_name = "Brooklyn, NY"
-                elif city_normalized in ["bronx,ny", "bronx"] or city_lower.startswith("bronx"):
-                    location_name = "Bronx, NY"
-                elif city_normalized in ["staten island,ny", "staten island"] or city_lower.startswith("staten island"):
-                    location_name = "Staten Island, NY"
-                elif city_normalized in ["new york,ny", "new york"] or city_lower.startswith("new york"):
-                    location_name = "New York, NY"
-            
+            location_name = _display_name_for(city) if city else None
+
             # If we couldn't format from our database, use API response or fallback
             if not location_name:
                 if area_name:
@@ -324,36 +547,17 @@ class WeatherService:
                     if area_name:
                         location_name = f"{area_name}, {region}" if region else area_name
                     else:
-                        location_name = f"{lat:.2f}, {lon:.2f}" if lat and lon else "Unknown Location"
+                        location_name = f"{lat:.2f}, {lon:.2f}" if lat is not None and lon is not None else "Unknown Location"
             
             # Get temperature (wttr.in provides in both F and C)
             temp_f = int(current.get("temp_F", 70))
             temp_c = int(current.get("temp_C", 21))
             feels_like_f = int(current.get("FeelsLikeF", temp_f))
             
-            # Get condition
-            weather_desc = current.get("weatherDesc", [{}])[0].get("value", "Clear")
-            # Map wttr.in descriptions to our condition types
-            condition_map = {
-                "sunny": "Clear",
-                "clear": "Clear",
-                "partly cloudy": "Clouds",
-                "cloudy": "Clouds",
-                "overcast": "Clouds",
-                "mist": "Mist",
-                "fog": "Fog",
-                "light rain": "Rain",
-                "moderate rain": "Rain",
-                "heavy rain": "Rain",
-                "light snow": "Snow",
-                "moderate snow": "Snow",
-                "heavy snow": "Snow",
-            }
-            condition = "Clear"
-            for key, value in condition_map.items():
-                if key in weather_desc.lower():
-                    condition = value
-                    break
+            # Get condition: one scan of the description classifies it
+            weather_desc = (current.get("weatherDesc") or _EMPTY_ROW)[0].get("value", "Clear")
+            condition_match = _WTTR_CONDITION_RE.search(weather_desc.lower())
+            condition = _WTTR_CONDITION_MAP[condition_match.group()] if condition_match else "Clear"
             
             humidity = int(current.get("humidity", 50))
             wind_speed = int(float(current.get("windspeedMiles", 0)))
@@ -374,16 +578,8 @@ class WeatherService:
 
     def _get_fallback_weather(self) -> Dict:
         """Return fallback weather data when API is unavailable."""
-        return {
-            "temperature_f": 72,
-            "temperature_c": 22,
-            "feels_like_f": 72,
-            "condition": "Clear",
-            "description": "Clear sky",
-            "humidity": 50,
-            "wind_speed": 5,
-            "location": "Queens, NY"
-        }
+        # Copy, since callers overwrite the display location
+        return dict(_FALLBACK_WEATHER)
 
     def format_weather_response(self, weather_data: Dict, include_joke: bool = False, 
                                 requested_location: Optional[str] = None) -> str:
@@ -404,6 +600,9 @@ class WeatherService:
         feels_like = weather_data["feels_like_f"]
         humidity = weather_data["humidity"]
         wind = weather_data["wind_speed"]
+        # Lowercased once; the joke templates and the regular path each
+        # interpolate it
+        desc_lower = description.lower()
         # ALWAYS use requested location if provided - this ensures we show the correct location name
         # even if the API returns a different name (e.g., API returns "New York" for Little Neck coordinates)
         if requested_location:
@@ -411,60 +610,36 @@ class WeatherService:
         else:
             location = weather_data.get("location", "Unknown location")
 
-        # Weather emoji mapping
-        emoji_map = {
-            "Clear": "☀️",
-            "Clouds": "☁️",
-            "Rain": "🌧️",
-            "Drizzle": "🌦️",
-            "Thunderstorm": "⛈️",
-            "Snow": "❄️",
-            "Mist": "🌫️",
-            "Fog": "🌫️",
-            "Haze": "🌫️"
-        }
-        emoji = emoji_map.get(condition, "🌤️")
+        emoji = _EMOJI_MAP.get(condition, _DEFAULT_EMOJI)
 
         if include_joke:
-            jokes = [
-                f"The meteorologist's favorite type of music? Heavy metal - especially when it's hailing! Currently in {location}: {temp}°F with {description.lower()}! {emoji}",
-                f"Why do clouds never get lonely? Because they're always in good company - they're quite the cumulus crowd! Right now in {location} it's {temp}°F with {description.lower()}! {emoji}",
-                f"What did the barometric pressure say to the thermometer? 'I'm feeling quite under pressure today, but you seem to be rising to the occasion!' In {location}: {temp}°F with {description.lower()}! {emoji}",
-                f"The wind's favorite type of literature? Gust-ave Flaubert novels, naturally! Today in {location}: {temp}°F with {description.lower()} and light winds! {emoji}",
-                f"Why did the dew point become a philosopher? Because it was always questioning the humidity of existence! Current conditions in {location}: {temp}°F with {description.lower()}! {emoji}",
-                f"What's a tornado's favorite dance? The twist, obviously! But don't worry, in {location} it's just {temp}°F with {description.lower()}! {emoji}"
-            ]
-            import random
-            return random.choice(jokes)
-
-        # Regular weather response
-        response = f"Current weather in {location}: {temp}°F"
+            return _RNG.choice(_JOKE_TEMPLATES).format(
+                location=location, temp=temp, desc=desc_lower, emoji=emoji
+            )
+
+        # Regular weather response; collect fragments and join once instead
+        # of reallocating the growing string per +=
+        parts = [f"Current weather in {location}: {temp}°F"]
         if feels_like != temp:
-            response += f" (feels like {feels_like}°F)"
-        response += f" with {description.lower()}. {emoji}"
-        
+            parts.append(f" (feels like {feels_like}°F)")
+        parts.append(f" with {desc_lower}. {emoji}")
+
         if humidity > 70:
-            response += f" It's quite humid ({humidity}% humidity)."
+            parts.append(f" It's quite humid ({humidity}% humidity).")
         elif humidity < 30:
-            response += f" The air is dry ({humidity}% humidity)."
-        
+            parts.append(f" The air is dry ({humidity}% humidity).")
+
         if wind > 15:
-            response += f" Windy conditions with {wind} mph winds."
+            parts.append(f" Windy conditions with {wind} mph winds.")
         elif wind > 5:
-            response += f" Light breeze at {wind} mph."
-
-        return response
-
+            parts.append(f" Light breeze at {wind} mph.")
 
-# Global weather service instance
-_weather_service: Optional[WeatherService] = None
+        return "".join(parts)
 
 
+@cache
 def get_weather_service() -> WeatherService:
     """Get or create the global weather service instance."""
-    global _weather_service
-    if _weather_service is None:
-        _weather_service = WeatherService()
-    return _weather_service
+    return WeatherService()
 
 